@@ -14,17 +14,21 @@ import functools
 import json
 import logging
 import os
-import uuid
+import time
 from typing import Any, Callable, Optional
 
+from functions.shared.ids import fast_uuid4
+
 logger = logging.getLogger(__name__)
 
 try:
-    import jwt as pyjwt
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
     from jwt.algorithms import RSAAlgorithm
+    from jwt.utils import base64url_decode
     HAS_JWT = True
 except ImportError:
-    pyjwt = None  # type: ignore[assignment]
     HAS_JWT = False
 
 try:
@@ -34,6 +38,13 @@ except ImportError:
     _requests = None  # type: ignore[assignment]
     HAS_REQUESTS = False
 
+try:
+    import azure.functions as _func  # type: ignore[import]
+    HAS_AZURE_FUNCTIONS = True
+except ImportError:
+    _func = None  # type: ignore[assignment]
+    HAS_AZURE_FUNCTIONS = False
+
 
 # ─── Auth error ──────────────────────────────────────────────────────────────
 
@@ -52,10 +63,13 @@ class JWTValidator:
     Azure AD RS256 JWT validator.
 
     Fetches public keys from the Azure AD JWKS endpoint and validates:
-    - Signature (RS256 via JWKS)
+    - Signature (RS256 via JWKS, verified directly with cryptography)
     - Issuer  (iss == https://login.microsoftonline.com/{tenant_id}/v2.0)
     - Audience (aud == client_id)
-    - Expiration (exp) and not-before (nbf)
+    - Expiration (exp), not-before (nbf) and issued-at (iat)
+
+    Claims are checked by _check_claims, which mirrors PyJWT's rules; PyJWT
+    itself only supplies the JWK parsing and base64url helpers.
 
     Task 3.3: JWKS URI is derived from AZURE_AD_TENANT_ID env var.
     """
@@ -84,6 +98,10 @@ class JWTValidator:
         """
         Validate a Bearer token and return verified claims.
 
+        The token is split and each segment decoded exactly once: the parsed
+        header drives key lookup, the RS256 signature is checked directly with
+        the JWKS public key, then claims are checked on the decoded payload.
+
         Raises:
             AuthError: on any validation failure (expired, tampered, missing key…).
         """
@@ -91,9 +109,12 @@ class JWTValidator:
             raise AuthError("PyJWT not available")
 
         try:
-            header = pyjwt.get_unverified_header(token)  # type: ignore[union-attr]
-        except pyjwt.DecodeError as exc:  # type: ignore[union-attr]
+            header_b64, payload_b64, sig_b64 = token.split(".")
+            header = json.loads(base64url_decode(header_b64))  # type: ignore[possibly-undefined]
+        except (ValueError, TypeError) as exc:
             raise AuthError(f"Malformed token: {exc}") from exc
+        if not isinstance(header, dict):
+            raise AuthError("Malformed token: header is not a JSON object")
 
         alg = header.get("alg", "")
         if alg != "RS256":
@@ -107,29 +128,56 @@ class JWTValidator:
             raise AuthError(f"Cannot retrieve signing key: {exc}") from exc
 
         try:
-            claims: dict = pyjwt.decode(  # type: ignore[union-attr]
-                token,
-                public_key,
-                algorithms=["RS256"],
-                audience=self.client_id,
-                options={"verify_exp": True, "verify_nbf": True, "verify_iss": True},
-                issuer=self.issuer,
+            public_key.verify(
+                base64url_decode(sig_b64),  # type: ignore[possibly-undefined]
+                f"{header_b64}.{payload_b64}".encode("ascii"),
+                padding.PKCS1v15(),  # type: ignore[possibly-undefined]
+                hashes.SHA256(),  # type: ignore[possibly-undefined]
             )
-        except pyjwt.ExpiredSignatureError as exc:  # type: ignore[union-attr]
-            raise AuthError("Token has expired") from exc
-        except pyjwt.InvalidAudienceError as exc:  # type: ignore[union-attr]
-            raise AuthError("Invalid token audience") from exc
-        except pyjwt.InvalidIssuerError as exc:  # type: ignore[union-attr]
-            raise AuthError("Invalid token issuer") from exc
-        except pyjwt.InvalidSignatureError as exc:  # type: ignore[union-attr]
+        except InvalidSignature as exc:  # type: ignore[possibly-undefined]
             raise AuthError("Invalid token signature") from exc
-        except pyjwt.DecodeError as exc:  # type: ignore[union-attr]
+        except (ValueError, TypeError) as exc:
             raise AuthError(f"Token decode error: {exc}") from exc
-        except pyjwt.InvalidTokenError as exc:  # type: ignore[union-attr]
-            raise AuthError(f"Invalid token: {exc}") from exc
 
+        try:
+            claims = json.loads(base64url_decode(payload_b64))  # type: ignore[possibly-undefined]
+        except (ValueError, TypeError) as exc:
+            raise AuthError(f"Token decode error: {exc}") from exc
+        if not isinstance(claims, dict):
+            raise AuthError("Token decode error: payload is not a JSON object")
+
+        self._check_claims(claims)
         return claims
 
+    def _check_claims(self, claims: dict) -> None:
+        """Registered-claim checks (exp, nbf, iat, aud, iss) — same rules as PyJWT."""
+        now = time.time()
+        try:
+            if "exp" in claims and int(claims["exp"]) <= now:
+                raise AuthError("Token has expired")
+            if "nbf" in claims and int(claims["nbf"]) > now:
+                raise AuthError("Invalid token: The token is not yet valid (nbf)")
+            if "iat" in claims and int(claims["iat"]) > now:
+                raise AuthError("Invalid token: The token is not yet valid (iat)")
+        except (ValueError, TypeError, OverflowError) as exc:
+            raise AuthError(f"Token decode error: non-integer time claim ({exc})") from exc
+
+        aud = claims.get("aud")
+        if not aud:
+            raise AuthError('Invalid token: Token is missing the "aud" claim')
+        audiences = [aud] if isinstance(aud, str) else aud
+        if (
+            not isinstance(audiences, list)
+            or not all(isinstance(a, str) for a in audiences)
+            or self.client_id not in audiences
+        ):
+            raise AuthError("Invalid token audience")
+
+        if "iss" not in claims:
+            raise AuthError('Invalid token: Token is missing the "iss" claim')
+        if claims["iss"] != self.issuer:
+            raise AuthError("Invalid token issuer")
+
     def _get_public_key(self, kid: Optional[str]) -> Any:
         """Fetch (and cache) JWKS; return public key matching kid."""
         if self._jwks_cache is None:
@@ -157,41 +205,56 @@ class JWTValidator:
 # ─── Module-level validator (one instance per function host cold-start) ───────
 
 _validator: Optional[JWTValidator] = None
+_auth_config: Optional[tuple[str, str]] = None
+
+
+def _get_auth_config() -> tuple[str, str]:
+    """(tenant_id, client_id) from env — read once, cleared by reset_validator()."""
+    global _auth_config
+    if _auth_config is None:
+        _auth_config = (
+            os.environ.get("AZURE_AD_TENANT_ID", ""),
+            os.environ.get("AZURE_AD_CLIENT_ID", ""),
+        )
+    return _auth_config
 
 
 def get_validator(jwks_override: Optional[dict] = None) -> JWTValidator:
     """
     Return (or create) the module-level JWTValidator.
 
-    Task 3.2: Reads AZURE_AD_TENANT_ID + AZURE_AD_CLIENT_ID from env.
+    Task 3.2: Reads AZURE_AD_TENANT_ID + AZURE_AD_CLIENT_ID from env (once).
     jwks_override bypasses the JWKS HTTP call for tests.
     """
     global _validator
 
+    if _validator is not None and jwks_override is None:
+        return _validator
+
+    tenant_id, client_id = _get_auth_config()
+
     if jwks_override is not None:
         # Test mode: fresh validator with injected JWKS
         return JWTValidator(
-            tenant_id=os.environ.get("AZURE_AD_TENANT_ID", "test-tenant"),
-            client_id=os.environ.get("AZURE_AD_CLIENT_ID", "test-client"),
+            tenant_id=tenant_id or "test-tenant",
+            client_id=client_id or "test-client",
             jwks_override=jwks_override,
         )
 
-    if _validator is None:
-        tenant_id = os.environ.get("AZURE_AD_TENANT_ID", "")
-        client_id = os.environ.get("AZURE_AD_CLIENT_ID", "")
-        if not tenant_id or not client_id:
-            raise EnvironmentError(
-                "AZURE_AD_TENANT_ID and AZURE_AD_CLIENT_ID must be configured"
-            )
-        _validator = JWTValidator(tenant_id=tenant_id, client_id=client_id)
+    if not tenant_id or not client_id:
+        raise EnvironmentError(
+            "AZURE_AD_TENANT_ID and AZURE_AD_CLIENT_ID must be configured"
+        )
+    _validator = JWTValidator(tenant_id=tenant_id, client_id=client_id)
 
     return _validator
 
 
 def reset_validator() -> None:
-    """Clear the cached validator (useful in tests that change env vars)."""
-    global _validator
+    """Clear the cached validator and env config (useful in tests that change env vars)."""
+    global _validator, _auth_config
     _validator = None
+    _auth_config = None
 
 
 # ─── Token extraction ─────────────────────────────────────────────────────────
@@ -201,12 +264,15 @@ def extract_bearer_token(authorization_header: str) -> Optional[str]:
     Parse 'Authorization: Bearer <token>' and return the raw token.
     Returns None if the header is absent or malformed.
     """
-    if not authorization_header:
+    # Fixed-offset compare: scheme is 6 chars followed by a single space.
+    if (
+        not authorization_header
+        or len(authorization_header) < 8
+        or authorization_header[6] != " "
+        or authorization_header[:6].lower() != "bearer"
+    ):
         return None
-    parts = authorization_header.split(None, 1)
-    if len(parts) == 2 and parts[0].lower() == "bearer":
-        return parts[1]
-    return None
+    return authorization_header[7:].strip() or None
 
 
 # ─── @require_auth decorator ─────────────────────────────────────────────────
@@ -229,7 +295,7 @@ def require_auth(handler: Callable) -> Callable:
     """
     @functools.wraps(handler)
     def wrapper(req: Any) -> Any:
-        request_id = str(uuid.uuid4())
+        request_id = fast_uuid4()
 
         auth_header = ""
         if hasattr(req, "headers"):
@@ -262,33 +328,30 @@ def require_auth(handler: Callable) -> Callable:
     return wrapper
 
 
+# Pre-serialized 401 body — only request_id and the JSON-escaped message vary.
+_401_BODY_TEMPLATE = (
+    b'{"request_id": "%s", "status_code": 401, "error": "Unauthorized", '
+    b'"message": %s, "details": {}}'
+)
+_401_HEADERS = {"WWW-Authenticate": 'Bearer realm="api"'}
+
+
 def _make_401(message: str, request_id: str) -> Any:
     """Build a 401 response — Azure Functions HttpResponse or plain _Response."""
-    body = json.dumps({
-        "request_id": request_id,
-        "status_code": 401,
-        "error": "Unauthorized",
-        "message": message,
-        "details": {},
-    })
-    headers = {
-        "X-Request-Id": request_id,
-        "WWW-Authenticate": 'Bearer realm="api"',
-    }
-
-    try:
-        import azure.functions as func  # type: ignore[import]
-        return func.HttpResponse(
+    body = _401_BODY_TEMPLATE % (request_id.encode("ascii"), json.dumps(message).encode("ascii"))
+    headers = {**_401_HEADERS, "X-Request-Id": request_id}
+
+    if HAS_AZURE_FUNCTIONS:
+        return _func.HttpResponse(  # type: ignore[union-attr]
             body, status_code=401, mimetype="application/json", headers=headers,
         )
-    except ImportError:
-        return _Response(body=body, status_code=401, headers=headers)
+    return _Response(body=body, status_code=401, headers=headers)
 
 
 class _Response:
     """Lightweight response object used when azure.functions is unavailable."""
 
-    def __init__(self, body: str, status_code: int, headers: dict):
+    def __init__(self, body: str | bytes, status_code: int, headers: dict):
         self._body = body
         self.status_code = status_code
         self.headers = headers
@@ -6,10 +6,11 @@ Logs to both Python logging (→ Application Insights) and Bronze audit files.
 """
 
 import logging
-import uuid
 from datetime import datetime, timezone
 from typing import Any
 
+from functions.shared.ids import fast_uuid4
+
 logger = logging.getLogger(__name__)
 
 
@@ -82,7 +83,7 @@ class AuditLogger:
     ) -> dict:
         """Build a structured audit log entry."""
         entry = {
-            "job_id": job_id or str(uuid.uuid4()),
+            "job_id": job_id or fast_uuid4(),
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "source": self.source,
             "status": status,
@@ -14,6 +14,22 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Fixed top-level Bronze tree, created once when running in local mode.
+LOCAL_SKELETON = (
+    "rte/production",
+    "audit/ingestion",
+    "reference/capacity",
+    "reference/capacity/errors",
+)
+
+
+def _format_timestamp(ts: datetime) -> tuple[str, str]:
+    """Return (YYYYMMDDTHHMMSSZ, YYYY/MM/DD) without going through strftime."""
+    return (
+        f"{ts.year:04d}{ts.month:02d}{ts.day:02d}T{ts.hour:02d}{ts.minute:02d}{ts.second:02d}Z",
+        f"{ts.year:04d}/{ts.month:02d}/{ts.day:02d}",
+    )
+
 
 class BronzeStorage:
     """Write raw API data to Bronze layer (ADLS Gen2 or local filesystem)."""
@@ -30,6 +46,9 @@ class BronzeStorage:
 
         if self.local_mode:
             self.local_root = Path(local_root or "bronze")
+            self._known_dirs: set[Path] = set()
+            for sub in LOCAL_SKELETON:
+                self._ensure_dir(self.local_root / sub)
             logger.info("BronzeStorage in LOCAL mode: %s", self.local_root)
         else:
             from azure.identity import DefaultAzureCredential
@@ -63,8 +82,7 @@ class BronzeStorage:
             Full path of the written file.
         """
         ts = timestamp or datetime.now(timezone.utc)
-        ts_str = ts.strftime("%Y%m%dT%H%M%SZ")
-        date_path = ts.strftime("%Y/%m/%d")
+        ts_str, date_path = _format_timestamp(ts)
 
         filename = f"eco2mix_regional_{ts_str}.json"
         full_path = f"{source}/{sub_path}/{date_path}/{filename}"
@@ -83,8 +101,7 @@ class BronzeStorage:
     ) -> str:
         """Write an audit log entry to Bronze audit layer."""
         ts = timestamp or datetime.now(timezone.utc)
-        ts_str = ts.strftime("%Y%m%dT%H%M%SZ")
-        date_path = ts.strftime("%Y/%m/%d")
+        ts_str, date_path = _format_timestamp(ts)
 
         filename = f"heartbeat_{ts_str}.json"
         full_path = f"audit/ingestion/{date_path}/{filename}"
@@ -99,11 +116,29 @@ class BronzeStorage:
     def _write_local(self, path: str, content: str) -> str:
         """Write to local filesystem (dev mode)."""
         full_path = self.local_root / path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content, encoding="utf-8")
+        self._ensure_dir(full_path.parent)
+        try:
+            full_path.write_text(content, encoding="utf-8")
+        except FileNotFoundError:
+            # Directory removed since it was cached — recreate it and retry once
+            self._known_dirs.discard(full_path.parent)
+            self._ensure_dir(full_path.parent)
+            full_path.write_text(content, encoding="utf-8")
         logger.info("Written (local): %s (%d bytes)", full_path, len(content))
         return str(full_path)
 
+    def _ensure_dir(self, directory: Path) -> None:
+        """
+        Create a local directory once per process; later calls skip the syscalls.
+
+        The cache goes stale if the directory is deleted while the process runs;
+        _write_local recovers from that by discarding the entry and retrying.
+        """
+        if directory in self._known_dirs:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        self._known_dirs.add(directory)
+
     def _write_adls(self, path: str, content: str) -> str:
         """Write to ADLS Gen2 (production mode)."""
         file_client = self.fs_client.get_file_client(path)
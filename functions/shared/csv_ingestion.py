@@ -6,11 +6,14 @@ Validates structure (non-empty, parseable headers), moves
 malformed files to errors/, and logs audit entries.
 """
 
+import codecs
 import csv
-import io
+import itertools
 import logging
+import shutil
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +27,9 @@ RECOMMENDED_COLUMNS = {
     "annee",
 }
 
+# Stream-copy buffer: files are never held in memory as a whole.
+COPY_BUFFER_SIZE = 1 << 20
+
 
 class CSVValidationError(Exception):
     """Raised when CSV validation fails."""
@@ -60,12 +66,12 @@ class CSVIngestion:
         logger.info("Ingesting CSV: %s", filename)
 
         try:
-            # Read and validate
-            content = filepath.read_text(encoding="utf-8-sig")  # handles BOM
-            row_count = self._validate(content, filename)
+            # Validate by streaming rows (utf-8-sig handles BOM)
+            with filepath.open(encoding="utf-8-sig", newline="") as f:
+                row_count = self._validate(f, filename)
 
-            # Write raw CSV to Bronze (no transformation)
-            bronze_path = self._write_to_bronze(content, filename)
+            # Stream raw CSV bytes to Bronze (no transformation)
+            bronze_path = self._write_to_bronze(filepath, filename)
 
             logger.info(
                 "CSV ingested: %s → %s (%d rows)", filename, bronze_path, row_count
@@ -80,9 +86,7 @@ class CSVIngestion:
 
         except CSVValidationError as e:
             logger.error("CSV validation failed: %s — %s", filename, e)
-            error_path = self._write_to_errors(
-                filepath.read_text(encoding="utf-8-sig"), filename, str(e)
-            )
+            error_path = self._write_to_errors(filepath, filename, str(e))
 
             if self.audit:
                 return self.audit.log_failure(
@@ -120,9 +124,9 @@ class CSVIngestion:
         )
         return results
 
-    def _validate(self, content: str, filename: str) -> int:
+    def _validate(self, lines: Iterable[str], filename: str) -> int:
         """
-        Validate CSV content.
+        Validate CSV content, consuming it line by line.
 
         Returns:
             Number of data rows.
@@ -130,14 +134,17 @@ class CSVIngestion:
         Raises:
             CSVValidationError: If validation fails.
         """
-        # Check not empty
-        stripped = content.strip()
-        if not stripped:
+        # Check not empty (leading and trailing blank lines are ignored)
+        lines = self._without_trailing_blanks(
+            itertools.dropwhile(lambda line: not line.strip(), lines)
+        )
+        first = next(lines, None)
+        if first is None:
             raise CSVValidationError("File is empty", filename)
 
         # Check parseable
         try:
-            reader = csv.DictReader(io.StringIO(stripped))
+            reader = csv.DictReader(itertools.chain((first,), lines))
             headers = reader.fieldnames
         except csv.Error as e:
             raise CSVValidationError(f"CSV parse error: {e}", filename)
@@ -154,14 +161,37 @@ class CSVIngestion:
             )
 
         # Count rows
-        rows = list(reader)
-        if not rows:
+        try:
+            row_count = sum(1 for _ in reader)
+        except csv.Error as e:
+            raise CSVValidationError(f"CSV parse error: {e}", filename)
+        if not row_count:
             raise CSVValidationError("File has headers but no data rows", filename)
 
-        return len(rows)
-
-    def _write_to_bronze(self, content: str, filename: str) -> str:
-        """Write raw CSV to Bronze layer."""
+        return row_count
+
+    @staticmethod
+    def _without_trailing_blanks(lines: Iterable[str]) -> Iterator[str]:
+        """Yield lines, holding back whitespace-only ones until a non-blank line follows."""
+        pending: list[str] = []
+        for line in lines:
+            if line.strip():
+                yield from pending
+                pending.clear()
+                yield line
+            else:
+                pending.append(line)
+
+    @staticmethod
+    def _open_without_bom(src: Path) -> BinaryIO:
+        """Open src for binary reading, positioned past a UTF-8 BOM if present."""
+        f = src.open("rb")
+        if f.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+            f.seek(0)
+        return f
+
+    def _write_to_bronze(self, src: Path, filename: str) -> str:
+        """Stream raw CSV bytes to Bronze layer."""
         ts = datetime.now(timezone.utc)
         ts_str = ts.strftime("%Y%m%dT%H%M%SZ")
         date_path = ts.strftime("%Y/%m")
@@ -170,20 +200,22 @@ class CSVIngestion:
         dest_filename = f"{stem}_{ts_str}.csv"
         full_path = f"reference/capacity/{date_path}/{dest_filename}"
 
-        if self.bronze.local_mode:
-            dest = self.bronze.local_root / full_path
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_text(content, encoding="utf-8")
-            logger.info("Written (local): %s", dest)
-            return str(dest)
-        else:
-            file_client = self.bronze.fs_client.get_file_client(full_path)
-            file_client.upload_data(content.encode("utf-8"), overwrite=True)
-            logger.info("Written (ADLS): bronze/%s", full_path)
-            return f"bronze/{full_path}"
-
-    def _write_to_errors(self, content: str, filename: str, error: str) -> str:
-        """Write malformed CSV to errors directory."""
+        with self._open_without_bom(src) as src_f:
+            if self.bronze.local_mode:
+                dest = self.bronze.local_root / full_path
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                with dest.open("wb") as dst_f:
+                    shutil.copyfileobj(src_f, dst_f, length=COPY_BUFFER_SIZE)
+                logger.info("Written (local): %s", dest)
+                return str(dest)
+            else:
+                file_client = self.bronze.fs_client.get_file_client(full_path)
+                file_client.upload_data(src_f, overwrite=True)
+                logger.info("Written (ADLS): bronze/%s", full_path)
+                return f"bronze/{full_path}"
+
+    def _write_to_errors(self, src: Path, filename: str, error: str) -> str:
+        """Stream malformed CSV to errors directory."""
         ts = datetime.now(timezone.utc)
         ts_str = ts.strftime("%Y%m%dT%H%M%SZ")
 
@@ -194,7 +226,8 @@ class CSVIngestion:
         if self.bronze.local_mode:
             dest = self.bronze.local_root / full_path
             dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_text(content, encoding="utf-8")
+            with self._open_without_bom(src) as src_f, dest.open("wb") as dst_f:
+                shutil.copyfileobj(src_f, dst_f, length=COPY_BUFFER_SIZE)
             # Also write error metadata
             meta_path = dest.with_suffix(".meta.json")
             import json
@@ -210,5 +243,6 @@ class CSVIngestion:
             return str(dest)
         else:
             file_client = self.bronze.fs_client.get_file_client(full_path)
-            file_client.upload_data(content.encode("utf-8"), overwrite=True)
+            with self._open_without_bom(src) as src_f:
+                file_client.upload_data(src_f, overwrite=True)
             return f"bronze/{full_path}"
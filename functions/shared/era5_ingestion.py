@@ -71,7 +71,7 @@ class ERA5Ingestion:
             output_dir: Local output directory (dev mode). If None, uses Bronze storage.
 
         Returns:
-            Summary dict: {total_rows, files_written, regions_processed}.
+            Summary dict: {total_rows, files_written, paths, regions_processed}.
         """
         source_path = Path(source_path)
         logger.info("Scanning ERA5 Parquet: %s", source_path)
@@ -108,14 +108,15 @@ class ERA5Ingestion:
             logger.warning("No ERA5 data after filtering")
             if self.audit:
                 self.audit.log_success(record_count=0, details={"era5": "no_data"})
-            return {"total_rows": 0, "files_written": 0, "regions_processed": []}
+            return {"total_rows": 0, "files_written": 0, "paths": [], "regions_processed": []}
 
         # Write partitioned output
-        files_written = self._write_partitioned(df, output_dir)
+        paths = self._write_partitioned(df, output_dir)
 
         summary = {
             "total_rows": len(df),
-            "files_written": files_written,
+            "files_written": len(paths),
+            "paths": paths,
             "regions_processed": df["region_code"].unique().sort().to_list(),
         }
 
@@ -129,7 +130,8 @@ class ERA5Ingestion:
         if self.audit:
             self.audit.log_success(
                 record_count=len(df),
-                details={"era5": summary},
+                # Partition paths can run to thousands of entries — keep them out of the heartbeat
+                details={"era5": {k: v for k, v in summary.items() if k != "paths"}},
             )
 
         return summary
@@ -158,7 +160,7 @@ class ERA5Ingestion:
         max_time = time_range["max_time"][0]
 
         total_rows = 0
-        total_files = 0
+        all_paths: list[str] = []
         all_regions = set()
 
         # Process month by month
@@ -177,7 +179,7 @@ class ERA5Ingestion:
             result = self._process_lazy_frame(chunk_lf, output_dir)
 
             total_rows += result["total_rows"]
-            total_files += result["files_written"]
+            all_paths.extend(result["paths"])
             all_regions.update(result["regions_processed"])
 
             logger.info("Chunk %s: %d rows", current.strftime("%Y-%m"), result["total_rows"])
@@ -185,7 +187,8 @@ class ERA5Ingestion:
 
         return {
             "total_rows": total_rows,
-            "files_written": total_files,
+            "files_written": len(all_paths),
+            "paths": all_paths,
             "regions_processed": sorted(all_regions),
         }
 
@@ -211,12 +214,13 @@ class ERA5Ingestion:
         df = lf.collect(engine="streaming")
 
         if df.is_empty():
-            return {"total_rows": 0, "files_written": 0, "regions_processed": []}
+            return {"total_rows": 0, "files_written": 0, "paths": [], "regions_processed": []}
 
-        files = self._write_partitioned(df, output_dir)
+        paths = self._write_partitioned(df, output_dir)
         return {
             "total_rows": len(df),
-            "files_written": files,
+            "files_written": len(paths),
+            "paths": paths,
             "regions_processed": df["region_code"].unique().sort().to_list(),
         }
 
@@ -254,10 +258,10 @@ class ERA5Ingestion:
 
     def _write_partitioned(
         self, df: pl.DataFrame, output_dir: str | Path | None
-    ) -> int:
-        """Write partitioned Parquet files by region and month."""
+    ) -> list[str]:
+        """Write partitioned Parquet files by region and month; return written paths."""
         ts_str = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        files_written = 0
+        written: list[str] = []
 
         groups = df.group_by(["region_code", "year", "month"])
         for (region, year, month), group_df in groups:
@@ -269,15 +273,15 @@ class ERA5Ingestion:
                 full_path.parent.mkdir(parents=True, exist_ok=True)
                 group_df.write_parquet(full_path)
                 logger.info("Written: %s (%d rows)", full_path, len(group_df))
+                written.append(str(full_path))
             elif self.bronze and self.bronze.local_mode:
                 full_path = self.bronze.local_root / path
                 full_path.parent.mkdir(parents=True, exist_ok=True)
                 group_df.write_parquet(full_path)
                 logger.info("Written (local): %s (%d rows)", full_path, len(group_df))
+                written.append(str(full_path))
 
-            files_written += 1
-
-        return files_written
+        return written
 
     # ─── Checkpoint management ───────────────────────────────────────────
 
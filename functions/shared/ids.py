@@ -0,0 +1,18 @@
+"""
+Identifier helpers — stdlib only, safe to import from any layer.
+"""
+
+import os
+
+
+def fast_uuid4() -> str:
+    """
+    Random RFC 4122 version-4 UUID string, built straight from os.urandom.
+
+    Equivalent to str(uuid.uuid4()) without constructing a uuid.UUID object.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
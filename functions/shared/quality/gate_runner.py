@@ -65,17 +65,17 @@ class GateRunner:
             config_path: Path to quality_gates.yaml.
             context: Dict with runtime context (DataFrames, DB connections).
         """
-        config_path = Path(config_path)
-        if not config_path.exists():
-            logger.error("Config file not found: %s", config_path)
+        config = self.load_config(config_path)
+        if config is None:
             return []
+        return self.run_from_parsed_config(config, context)
 
-        if HAS_YAML:
-            config = yaml.safe_load(config_path.read_text(encoding="utf-8"))  # type: ignore
-        else:
-            # Fallback: try JSON format
-            config = json.loads(config_path.read_text(encoding="utf-8"))
-
+    def run_from_parsed_config(
+        self,
+        config: dict,
+        context: dict | None = None,
+    ) -> list[dict]:
+        """Run all gates from an already-loaded config dict (see load_config)."""
         gates = config.get("gates", [])
         context = context or {}
 
@@ -87,6 +87,19 @@ class GateRunner:
 
         return self.results
 
+    @staticmethod
+    def load_config(config_path: str | Path) -> dict | None:
+        """Parse a gates config file (YAML, or JSON without PyYAML); None if missing."""
+        config_path = Path(config_path)
+        if not config_path.exists():
+            logger.error("Config file not found: %s", config_path)
+            return None
+
+        if HAS_YAML:
+            return yaml.safe_load(config_path.read_text(encoding="utf-8"))  # type: ignore
+        # Fallback: try JSON format
+        return json.loads(config_path.read_text(encoding="utf-8"))
+
     def run_checks(self, checks: list[dict], context: dict | None = None) -> list[dict]:
         """Run checks from a list of dicts (programmatic API)."""
         context = context or {}
@@ -99,21 +112,20 @@ class GateRunner:
 
     def get_summary(self) -> dict:
         """Get summary of all check results."""
-        total = len(self.results)
-        passed = sum(1 for r in self.results if r.get("status") == CheckStatus.PASS.value)
-        failed = sum(1 for r in self.results if r.get("status") == CheckStatus.FAIL.value)
-        warned = sum(1 for r in self.results if r.get("status") == CheckStatus.WARN.value)
-
-        has_critical_failure = any(
-            r.get("status") == CheckStatus.FAIL.value and r.get("severity") == Severity.CRITICAL.value
-            for r in self.results
-        )
+        # Single pass: per-status counts and critical-failure detection
+        counts: dict[str, int] = {}
+        has_critical_failure = False
+        for r in self.results:
+            status = r.get("status")
+            counts[status] = counts.get(status, 0) + 1
+            if status == CheckStatus.FAIL.value and r.get("severity") == Severity.CRITICAL.value:
+                has_critical_failure = True
 
         return {
-            "total_checks": total,
-            "passed": passed,
-            "failed": failed,
-            "warned": warned,
+            "total_checks": len(self.results),
+            "passed": counts.get(CheckStatus.PASS.value, 0),
+            "failed": counts.get(CheckStatus.FAIL.value, 0),
+            "warned": counts.get(CheckStatus.WARN.value, 0),
             "pipeline_should_halt": has_critical_failure,
         }
 
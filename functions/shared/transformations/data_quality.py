@@ -14,11 +14,14 @@ Strategies:
 import logging
 from enum import Enum
 from datetime import datetime, timezone
+from typing import TypeVar
 
 import polars as pl
 
 logger = logging.getLogger(__name__)
 
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
 
 class NullStrategy(str, Enum):
     """How to handle null values."""
@@ -61,21 +64,27 @@ ERA5_QUALITY_RULES: dict[str, NullStrategy] = {
 
 
 def apply_quality_rules(
-    df: pl.DataFrame,
+    df: FrameT,
     rules: dict[str, NullStrategy],
     source_name: str = "",
-) -> tuple[pl.DataFrame, dict]:
+) -> tuple[FrameT, dict]:
     """
-    Apply null handling rules to a DataFrame.
+    Apply null handling rules to a DataFrame or LazyFrame.
+
+    A LazyFrame input is returned uncollected so callers can fuse the
+    cleaning steps into a larger query.
 
     Args:
-        df: Input DataFrame.
+        df: Input DataFrame or LazyFrame.
         rules: Column → NullStrategy mapping.
         source_name: Source identifier for logging.
 
     Returns:
-        Tuple of (cleaned DataFrame, quality metrics dict).
+        Tuple of (cleaned frame of the same kind as the input, quality metrics dict).
     """
+    if isinstance(df, pl.LazyFrame):
+        return _apply_quality_rules_lazy(df, rules, source_name)
+
     metrics = {
         "source": source_name,
         "input_rows": len(df),
@@ -135,3 +144,74 @@ def apply_quality_rules(
     )
 
     return df, metrics
+
+
+def _apply_quality_rules_lazy(
+    lf: pl.LazyFrame,
+    rules: dict[str, NullStrategy],
+    source_name: str,
+) -> tuple[pl.LazyFrame, dict]:
+    """
+    LazyFrame path of apply_quality_rules.
+
+    Null statistics are gathered in one aggregate query; the cleaning steps
+    are then added to the plan without collecting it.
+    """
+    columns = set(lf.collect_schema().names())
+    present = {col: strategy for col, strategy in rules.items() if col in columns}
+
+    drop_cols = [col for col, s in present.items() if s == NullStrategy.DROP]
+    kept = (
+        ~pl.any_horizontal([pl.col(c).is_null() for c in drop_cols])
+        if drop_cols else pl.lit(True)
+    )
+
+    # Null counts before cleaning, and per column after row drops
+    stats = lf.select(
+        pl.len().alias("__input_rows"),
+        (~kept).sum().alias("__rows_dropped"),
+        *(pl.col(c).null_count().alias(f"__before_{c}") for c in present),
+        *(pl.col(c).filter(kept).null_count().alias(f"__after_{c}") for c in present),
+    ).collect().row(0, named=True)
+
+    metrics = {
+        "source": source_name,
+        "input_rows": stats["__input_rows"],
+        "nulls_found": {
+            col: stats[f"__before_{col}"] for col in present if stats[f"__before_{col}"] > 0
+        },
+        "rows_dropped": stats["__rows_dropped"] if drop_cols else 0,
+        "values_filled": 0,
+        "values_flagged": 0,
+    }
+
+    # Apply strategies
+    if drop_cols:
+        lf = lf.drop_nulls(subset=drop_cols)
+
+    exprs = []
+    for col, strategy in present.items():
+        null_count = stats[f"__after_{col}"]
+        if null_count == 0:
+            continue
+        if strategy == NullStrategy.FILL_ZERO:
+            exprs.append(pl.col(col).fill_null(0.0))
+            metrics["values_filled"] += null_count
+        elif strategy == NullStrategy.FORWARD_FILL:
+            exprs.append(pl.col(col).forward_fill())
+            metrics["values_filled"] += null_count
+        elif strategy == NullStrategy.FLAG:
+            exprs.append(pl.col(col).is_null().alias(f"{col}_is_null"))
+            metrics["values_flagged"] += null_count
+    if exprs:
+        lf = lf.with_columns(exprs)
+
+    metrics["output_rows"] = metrics["input_rows"] - metrics["rows_dropped"]
+
+    logger.info(
+        "Quality [%s]: %d→%d rows, %d dropped, %d filled, %d flagged",
+        source_name, metrics["input_rows"], metrics["output_rows"],
+        metrics["rows_dropped"], metrics["values_filled"], metrics["values_flagged"],
+    )
+
+    return lf, metrics
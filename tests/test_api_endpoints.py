@@ -47,6 +47,7 @@ from functions.shared.api.routes import (
 from functions.shared.gold.dim_loader import DimLoader
 from functions.shared.gold.fact_loader import FactLoader
 
+pytestmark = pytest.mark.sqlite
 
 # ─── Fixtures ────────────────────────────────────────────────────────────────
 
@@ -8,6 +8,7 @@ import pytest
 from functions.shared.asset_discovery import AssetDiscovery
 from functions.shared.asset_lifecycle import AssetLifecycle
 
+pytestmark = pytest.mark.sqlite
 
 @pytest.fixture
 def db():
@@ -1,5 +1,6 @@
 """Tests for audit_logger.py — Story 1.1, Task 5.3"""
 
+import uuid
 from unittest.mock import MagicMock
 
 import pytest
@@ -58,3 +59,10 @@ class TestAuditLogger:
         # Should not raise
         entry = logger_with_storage.log_success(record_count=5)
         assert entry["status"] == "success"
+
+    def test_generated_job_id_is_uuid4(self, logger_no_storage):
+        """Generated job_id is a canonical version-4 UUID string."""
+        entry = logger_no_storage.log_success(record_count=1)
+        parsed = uuid.UUID(entry["job_id"])
+        assert parsed.version == 4
+        assert str(parsed) == entry["job_id"]
@@ -41,6 +41,15 @@ def rsa_keys():
     return private_key, public_key, jwks
 
 
+@pytest.fixture(scope="session")
+def other_rsa_key():
+    """A second RSA-2048 private key that is NOT in the test JWKS."""
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.hazmat.backends import default_backend
+
+    return rsa.generate_private_key(65537, 2048, default_backend())
+
+
 @pytest.fixture(scope="session")
 def tenant_id():
     return "aaaaaaaa-0000-0000-0000-000000000000"
@@ -58,10 +67,12 @@ def _make_token(
     *,
     exp_offset: int = 3600,
     nbf_offset: int = -5,
+    iat_offset: int = 0,
     kid: str = "test-kid-001",
     aud_override: str | None = None,
     iss_override: str | None = None,
     extra_claims: dict | None = None,
+    omit_claims: tuple[str, ...] = (),
     algorithm: str = "RS256",
 ) -> str:
     """Build a JWT signed with the test RSA key."""
@@ -76,55 +87,71 @@ def _make_token(
         "aud": aud_override or client_id,
         "exp": now + exp_offset,
         "nbf": now + nbf_offset,
-        "iat": now,
+        "iat": now + iat_offset,
         "tid": tenant_id,
     }
     if extra_claims:
         payload.update(extra_claims)
+    for claim in omit_claims:
+        payload.pop(claim)
 
     headers = {"kid": kid, "alg": algorithm}
     return pyjwt.encode(payload, private_key, algorithm=algorithm, headers=headers)
 
 
+# ─── Pre-signed tokens (signed once per session) ─────────────────────────────
+
+@pytest.fixture(scope="session")
+def valid_token(rsa_keys, tenant_id, client_id):
+    priv, _, _ = rsa_keys
+    return _make_token(priv, tenant_id, client_id, exp_offset=86400)
+
+
+@pytest.fixture(scope="session")
+def expired_token(rsa_keys, tenant_id, client_id):
+    priv, _, _ = rsa_keys
+    return _make_token(priv, tenant_id, client_id, exp_offset=-10)
+
+
+@pytest.fixture(scope="session")
+def wrong_aud_token(rsa_keys, tenant_id, client_id):
+    priv, _, _ = rsa_keys
+    return _make_token(priv, tenant_id, client_id, aud_override="wrong-client")
+
+
 # ─── JWTValidator unit tests ─────────────────────────────────────────────────
 
 class TestJWTValidator:
 
-    def test_valid_token_returns_claims(self, rsa_keys, tenant_id, client_id):
+    def test_valid_token_returns_claims(self, rsa_keys, valid_token, tenant_id, client_id):
         """AC #2: Valid token → claims returned."""
         from functions.shared.api.auth import JWTValidator
 
-        priv, _, jwks = rsa_keys
-        token = _make_token(priv, tenant_id, client_id)
-
+        _, _, jwks = rsa_keys
         validator = JWTValidator(tenant_id, client_id, jwks_override=jwks)
-        claims = validator.validate(token)
+        claims = validator.validate(valid_token)
 
         assert claims["sub"] == "user-sub-001"
         assert claims["oid"] == "user-oid-001"
         assert "DataReader" in claims["roles"]
 
-    def test_expired_token_raises(self, rsa_keys, tenant_id, client_id):
+    def test_expired_token_raises(self, rsa_keys, expired_token, tenant_id, client_id):
         """AC #3: Expired token → AuthError."""
         from functions.shared.api.auth import JWTValidator, AuthError
 
-        priv, _, jwks = rsa_keys
-        token = _make_token(priv, tenant_id, client_id, exp_offset=-1)
-
+        _, _, jwks = rsa_keys
         validator = JWTValidator(tenant_id, client_id, jwks_override=jwks)
         with pytest.raises(AuthError, match="expired"):
-            validator.validate(token)
+            validator.validate(expired_token)
 
-    def test_wrong_audience_raises(self, rsa_keys, tenant_id, client_id):
+    def test_wrong_audience_raises(self, rsa_keys, wrong_aud_token, tenant_id, client_id):
         """AC #3: Wrong audience → AuthError."""
         from functions.shared.api.auth import JWTValidator, AuthError
 
-        priv, _, jwks = rsa_keys
-        token = _make_token(priv, tenant_id, client_id, aud_override="wrong-client")
-
+        _, _, jwks = rsa_keys
         validator = JWTValidator(tenant_id, client_id, jwks_override=jwks)
         with pytest.raises(AuthError, match="audience"):
-            validator.validate(token)
+            validator.validate(wrong_aud_token)
 
     def test_wrong_issuer_raises(self, rsa_keys, tenant_id, client_id):
         """AC #3: Wrong issuer → AuthError."""
@@ -140,21 +167,89 @@ class TestJWTValidator:
         with pytest.raises(AuthError, match="[Ii]ssuer"):
             validator.validate(token)
 
-    def test_tampered_signature_raises(self, rsa_keys, tenant_id, client_id):
+    def test_tampered_signature_raises(self, rsa_keys, other_rsa_key, tenant_id, client_id):
         """AC #3: Tampered payload → AuthError (invalid signature)."""
         from functions.shared.api.auth import JWTValidator, AuthError
-        from cryptography.hazmat.primitives.asymmetric import rsa
-        from cryptography.hazmat.backends import default_backend
 
         # Sign with a different (unknown) private key
-        other_key = rsa.generate_private_key(65537, 2048, default_backend())
-        priv, _, jwks = rsa_keys
-        token = _make_token(other_key, tenant_id, client_id)
+        _, _, jwks = rsa_keys
+        token = _make_token(other_rsa_key, tenant_id, client_id)
 
         validator = JWTValidator(tenant_id, client_id, jwks_override=jwks)
         with pytest.raises(AuthError):
             validator.validate(token)
 
+    def test_altered_payload_raises(self, rsa_keys, valid_token, tenant_id, client_id):
+        """AC #3: Payload swapped under a valid signature → invalid signature."""
+        import base64
+        from functions.shared.api.auth import JWTValidator, AuthError
+
+        _, _, jwks = rsa_keys
+        header_b64, _, sig_b64 = valid_token.split(".")
+        forged = base64.urlsafe_b64encode(
+            json.dumps({"sub": "attacker", "aud": client_id}).encode()
+        ).rstrip(b"=").decode()
+
+        validator = JWTValidator(tenant_id, client_id, jwks_override=jwks)
+        with pytest.raises(AuthError, match="signature"):
+            validator.validate(f"{header_b64}.{forged}.{sig_b64}")
+
+    def test_not_yet_valid_raises(self, rsa_keys, tenant_id, client_id):
+        """nbf in the future → AuthError."""
+        from functions.shared.api.auth import JWTValidator, AuthError
+
+        priv, _, jwks = rsa_keys
+        token = _make_token(priv, tenant_id, client_id, nbf_offset=600)
+
+        validator = JWTValidator(tenant_id, client_id, jwks_override=jwks)
+        with pytest.raises(AuthError, match="not yet valid"):
+            validator.validate(token)
+
+    @pytest.mark.parametrize("overrides, match", [
+        ({"iat_offset": 600}, r"not yet valid \(iat\)"),
+        ({"extra_claims": {"exp": "tomorrow"}}, "non-integer"),
+        ({"extra_claims": {"iat": "now"}}, "non-integer"),
+        ({"omit_claims": ("aud",)}, 'missing the "aud" claim'),
+        ({"omit_claims": ("iss",)}, 'missing the "iss" claim'),
+    ])
+    def test_registered_claim_rules(self, rsa_keys, tenant_id, client_id, overrides, match):
+        """Each registered-claim rule rejects like PyJWT does."""
+        from functions.shared.api.auth import JWTValidator, AuthError
+
+        priv, _, jwks = rsa_keys
+        token = _make_token(priv, tenant_id, client_id, **overrides)
+
+        validator = JWTValidator(tenant_id, client_id, jwks_override=jwks)
+        with pytest.raises(AuthError, match=match):
+            validator.validate(token)
+
+    def test_audience_list_containing_client_id(self, rsa_keys, tenant_id, client_id):
+        """A list aud is accepted when it names this client."""
+        from functions.shared.api.auth import JWTValidator
+
+        priv, _, jwks = rsa_keys
+        token = _make_token(
+            priv, tenant_id, client_id,
+            extra_claims={"aud": ["other-api", client_id]},
+        )
+
+        validator = JWTValidator(tenant_id, client_id, jwks_override=jwks)
+        assert validator.validate(token)["aud"] == ["other-api", client_id]
+
+    def test_audience_list_with_non_string_raises(self, rsa_keys, tenant_id, client_id):
+        """A non-string aud entry is rejected even if client_id is present."""
+        from functions.shared.api.auth import JWTValidator, AuthError
+
+        priv, _, jwks = rsa_keys
+        token = _make_token(
+            priv, tenant_id, client_id,
+            extra_claims={"aud": [1, client_id]},
+        )
+
+        validator = JWTValidator(tenant_id, client_id, jwks_override=jwks)
+        with pytest.raises(AuthError, match="audience"):
+            validator.validate(token)
+
     def test_malformed_token_raises(self, rsa_keys, tenant_id, client_id):
         """AC #3: Gibberish token → AuthError."""
         from functions.shared.api.auth import JWTValidator, AuthError
@@ -225,6 +320,10 @@ class TestExtractBearerToken:
         from functions.shared.api.auth import extract_bearer_token
         assert extract_bearer_token("") is None
 
+    def test_blank_token(self):
+        from functions.shared.api.auth import extract_bearer_token
+        assert extract_bearer_token("Bearer    ") is None
+
 
 # ─── Task 4.2: @require_auth decorator ───────────────────────────────────────
 
@@ -257,10 +356,6 @@ def _make_mock_handler(return_value: Any = None) -> MockHandler:
 
 class TestRequireAuthDecorator:
 
-    def _valid_token(self, rsa_keys, tenant_id, client_id) -> str:
-        priv, _, _ = rsa_keys
-        return _make_token(priv, tenant_id, client_id)
-
     def test_missing_auth_header_returns_401(self, rsa_keys, tenant_id, client_id):
         """AC #1: No Authorization header → 401."""
         from functions.shared.api.auth import require_auth, reset_validator
@@ -284,12 +379,11 @@ class TestRequireAuthDecorator:
         resp = decorated(req)
         assert resp.status_code == 401
 
-    def test_valid_token_calls_handler(self, rsa_keys, tenant_id, client_id):
+    def test_valid_token_calls_handler(self, valid_token):
         """AC #2: Valid token → handler is called."""
-        from functions.shared.api.auth import require_auth, reset_validator
+        from functions.shared.api.auth import require_auth
 
-        priv, _, jwks = rsa_keys
-        token = self._valid_token(rsa_keys, tenant_id, client_id)
+        token = valid_token
 
         handler = _make_mock_handler()
         decorated = require_auth(handler)
@@ -305,12 +399,11 @@ class TestRequireAuthDecorator:
         assert len(handler.calls) == 1
         mock_validator.validate.assert_called_once_with(token)
 
-    def test_valid_token_attaches_claims(self, rsa_keys, tenant_id, client_id):
+    def test_valid_token_attaches_claims(self, valid_token):
         """AC #2: Claims attached to request._auth_claims."""
         from functions.shared.api.auth import require_auth
 
-        token = self._valid_token(rsa_keys, tenant_id, client_id)
-        req = MockRequest(headers={"Authorization": f"Bearer {token}"})
+        req = MockRequest(headers={"Authorization": f"Bearer {valid_token}"})
 
         captured_req = []
 
@@ -324,15 +417,12 @@ class TestRequireAuthDecorator:
 
         assert captured_req[0]._auth_claims == {"sub": "u", "roles": []}
 
-    def test_expired_token_returns_401(self, rsa_keys, tenant_id, client_id):
+    def test_expired_token_returns_401(self, expired_token):
         """AC #3: Expired token → 401 with 'expired' message."""
         from functions.shared.api.auth import require_auth, AuthError
 
-        priv, _, jwks = rsa_keys
-        token = _make_token(priv, tenant_id, client_id, exp_offset=-1)
-
         handler = _make_mock_handler()
-        req = MockRequest(headers={"Authorization": f"Bearer {token}"})
+        req = MockRequest(headers={"Authorization": f"Bearer {expired_token}"})
 
         with patch("functions.shared.api.auth.get_validator") as mock_get:
             mock_get.return_value.validate.side_effect = AuthError("Token has expired")
@@ -367,6 +457,17 @@ class TestRequireAuthDecorator:
         assert "request_id" in body
         assert uuid.UUID(body["request_id"])  # valid UUID
 
+    def test_401_body_matches_error_response_shape(self):
+        """Pre-serialized 401 body keeps the standard error_response schema."""
+        from functions.shared.api.auth import require_auth
+        from functions.shared.api.error_handlers import error_response
+
+        req = MockRequest(headers={})
+        body = json.loads(require_auth(_make_mock_handler())(req).get_body())
+
+        expected = error_response(401, body["message"], body["request_id"])
+        assert body == expected
+
     def test_401_response_has_www_authenticate_header(self):
         """Standard WWW-Authenticate header on 401."""
         from functions.shared.api.auth import require_auth
@@ -396,17 +497,38 @@ class TestRequireAuthDecorator:
             reset_validator()
 
 
+class TestGetValidator:
+
+    def test_env_read_once_until_reset(self, monkeypatch):
+        """Validator and env config are cached until reset_validator()."""
+        from functions.shared.api.auth import get_validator, reset_validator
+
+        monkeypatch.setenv("AZURE_AD_TENANT_ID", "tenant-a")
+        monkeypatch.setenv("AZURE_AD_CLIENT_ID", "client-a")
+        reset_validator()
+        try:
+            first = get_validator()
+            monkeypatch.setenv("AZURE_AD_TENANT_ID", "tenant-b")
+            assert get_validator() is first
+            assert first.tenant_id == "tenant-a"
+
+            reset_validator()
+            assert get_validator().tenant_id == "tenant-b"
+        finally:
+            reset_validator()
+
+
 # ─── Task 4.3: Integration — full auth flow ───────────────────────────────────
 
 class TestAuthIntegration:
     """Full flow: valid token → validator → handler called / 401 returned."""
 
-    def test_full_flow_valid_token(self, rsa_keys, tenant_id, client_id):
+    def test_full_flow_valid_token(self, rsa_keys, valid_token, tenant_id, client_id):
         """AC #2: Valid token flows all the way through."""
         from functions.shared.api.auth import require_auth, JWTValidator
 
-        priv, _, jwks = rsa_keys
-        token = _make_token(priv, tenant_id, client_id)
+        _, _, jwks = rsa_keys
+        token = valid_token
 
         # Create validator with correct tenant/client and injected JWKS (no HTTP call)
         validator = JWTValidator(tenant_id=tenant_id, client_id=client_id, jwks_override=jwks)
@@ -427,12 +549,12 @@ class TestAuthIntegration:
         assert claims["sub"] == "user-sub-001"
         assert claims["tid"] == tenant_id
 
-    def test_full_flow_expired_token_returns_401(self, rsa_keys, tenant_id, client_id):
+    def test_full_flow_expired_token_returns_401(self, rsa_keys, expired_token, tenant_id, client_id):
         """AC #3: Expired token — real validator → 401."""
         from functions.shared.api.auth import require_auth, JWTValidator
 
-        priv, _, jwks = rsa_keys
-        token = _make_token(priv, tenant_id, client_id, exp_offset=-10)
+        _, _, jwks = rsa_keys
+        token = expired_token
 
         validator = JWTValidator(tenant_id=tenant_id, client_id=client_id, jwks_override=jwks)
 
@@ -444,15 +566,12 @@ class TestAuthIntegration:
         body = json.loads(resp.get_body())
         assert "expired" in body["message"].lower()
 
-    def test_full_flow_tampered_token_returns_401(self, rsa_keys, tenant_id, client_id):
+    def test_full_flow_tampered_token_returns_401(self, rsa_keys, other_rsa_key, tenant_id, client_id):
         """AC #3: Token signed with unknown key → 401."""
         from functions.shared.api.auth import require_auth, JWTValidator
-        from cryptography.hazmat.primitives.asymmetric import rsa
-        from cryptography.hazmat.backends import default_backend
 
         _, _, jwks = rsa_keys
-        other_key = rsa.generate_private_key(65537, 2048, default_backend())
-        token = _make_token(other_key, tenant_id, client_id)
+        token = _make_token(other_rsa_key, tenant_id, client_id)
 
         validator = JWTValidator(tenant_id=tenant_id, client_id=client_id, jwks_override=jwks)
 
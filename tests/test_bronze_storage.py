@@ -1,6 +1,7 @@
 """Tests for bronze_storage.py — Story 1.1, Task 4.3"""
 
 import json
+import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -15,9 +16,9 @@ def local_storage(tmp_path):
     return BronzeStorage(local_mode=True, local_root=str(tmp_path))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_records():
-    """Load fixture from Story 0.1."""
+    """Load fixture from Story 0.1 (once per session — tests only read it)."""
     with open("tests/fixtures/rte_eco2mix_regional_sample.json") as f:
         return json.load(f)
 
@@ -66,3 +67,33 @@ class TestBronzeStorageLocal:
         stored = json.loads(Path(path).read_text(encoding="utf-8"))
         assert stored["job_id"] == "abc"
         assert stored["status"] == "failure"
+
+    def test_directory_created_once_per_partition(self, local_storage, monkeypatch):
+        """A second write to the same day partition makes no mkdir call."""
+        ts = datetime(2025, 3, 15, 10, 30, 0, tzinfo=timezone.utc)
+        local_storage.write_audit({"job_id": "a"}, timestamp=ts)
+
+        calls = []
+        real_mkdir = Path.mkdir
+
+        def counting_mkdir(self, *args, **kwargs):
+            calls.append(self)
+            return real_mkdir(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+        local_storage.write_audit({"job_id": "b"}, timestamp=ts.replace(minute=31))
+        assert calls == []
+
+    def test_write_recovers_from_deleted_directory(self, local_storage, tmp_path):
+        """A partition removed after being cached is recreated on the next write."""
+        ts = datetime(2025, 3, 15, 10, 30, 0, tzinfo=timezone.utc)
+        local_storage.write_audit({"job_id": "a"}, timestamp=ts)
+        shutil.rmtree(tmp_path / "audit/ingestion/2025")
+
+        path = local_storage.write_audit({"job_id": "b"}, timestamp=ts.replace(minute=31))
+        assert json.loads(Path(path).read_text(encoding="utf-8"))["job_id"] == "b"
+
+    def test_local_skeleton_created_on_init(self, local_storage, tmp_path):
+        """Top-level Bronze directories exist before the first write."""
+        for sub in ("rte/production", "audit/ingestion", "reference/capacity/errors"):
+            assert (tmp_path / sub).is_dir()
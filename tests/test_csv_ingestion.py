@@ -2,7 +2,7 @@
 
 
 from pathlib import Path
-from unittest.mock import MagicMock
+from typing import Any
 
 import pytest
 
@@ -10,6 +10,38 @@ from functions.shared.bronze_storage import BronzeStorage
 from functions.shared.csv_ingestion import CSVIngestion
 
 
+class _Recorder:
+    """Callable that records keyword calls and returns a fixed value."""
+
+    def __init__(self, return_value: dict) -> None:
+        self.return_value = return_value
+        self.calls: list[dict[str, Any]] = []
+
+    def __call__(self, **kwargs: Any) -> dict:
+        self.calls.append(kwargs)
+        return self.return_value
+
+    def assert_called_once(self) -> None:
+        assert len(self.calls) == 1, f"expected 1 call, got {len(self.calls)}"
+
+    @property
+    def call_args(self) -> tuple[tuple, dict[str, Any]]:
+        return (), self.calls[-1]
+
+
+class FakeAudit:
+    """Typed stand-in for AuditLogger — no MagicMock attribute autogen."""
+
+    def __init__(self) -> None:
+        self.log_success = _Recorder({"status": "success", "record_count": 0})
+        self.log_failure = _Recorder({"status": "failure", "error": ""})
+
+
+def _bronze_path(ingestion) -> Path:
+    """Bronze file written by the last successful ingest, as logged in audit."""
+    return Path(ingestion.audit.log_success.call_args[1]["details"]["bronze_path"])
+
+
 @pytest.fixture
 def local_storage(tmp_path):
     return BronzeStorage(local_mode=True, local_root=str(tmp_path))
@@ -17,13 +49,10 @@ def local_storage(tmp_path):
 
 @pytest.fixture
 def ingestion(local_storage):
-    audit = MagicMock()
-    audit.log_success.return_value = {"status": "success", "record_count": 0}
-    audit.log_failure.return_value = {"status": "failure", "error": ""}
-    return CSVIngestion(bronze_storage=local_storage, audit_logger=audit)
+    return CSVIngestion(bronze_storage=local_storage, audit_logger=FakeAudit())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_csv_path():
     return Path("tests/fixtures/capacity_sample.csv")
 
@@ -38,22 +67,60 @@ class TestCSVIngestionValid:
         call_kwargs = ingestion.audit.log_success.call_args
         assert call_kwargs[1]["record_count"] == 16
 
-    def test_file_written_to_bronze(self, ingestion, sample_csv_path, local_storage, tmp_path):
+    def test_file_written_to_bronze(self, ingestion, sample_csv_path):
         """CSV content is preserved in Bronze directory."""
         ingestion.ingest_file(sample_csv_path)
-        # Check files exist in bronze/reference/capacity/
-        capacity_files = list(tmp_path.rglob("*.csv"))
-        assert len(capacity_files) == 1
-        content = capacity_files[0].read_text(encoding="utf-8")
+        content = _bronze_path(ingestion).read_text(encoding="utf-8")
         assert "code_insee_region" in content
         assert "puissance_installee_mw" in content
 
+    def test_bronze_copy_is_byte_identical(self, ingestion, sample_csv_path):
+        """Raw bytes are streamed to Bronze unchanged."""
+        ingestion.ingest_file(sample_csv_path)
+        assert _bronze_path(ingestion).read_bytes() == sample_csv_path.read_bytes()
+
+    def test_bom_stripped_in_bronze(self, ingestion, tmp_path):
+        """A leading UTF-8 BOM is dropped, as with the former utf-8-sig decode."""
+        src = tmp_path / "landing" / "bom.csv"
+        src.parent.mkdir()
+        body = "code_insee_region,puissance_installee_mw\n11,100\n".encode("utf-8")
+        src.write_bytes(b"\xef\xbb\xbf" + body)
+        ingestion.ingest_file(src)
+        assert _bronze_path(ingestion).read_bytes() == body
+
+    def test_trailing_blank_lines_not_counted(self, ingestion, tmp_path):
+        """Whitespace-only trailing lines are not data rows."""
+        src = tmp_path / "trailing.csv"
+        src.write_text(
+            "code_insee_region,puissance_installee_mw\n11,100\n   \n  \n",
+            encoding="utf-8",
+        )
+        ingestion.ingest_file(src)
+        assert ingestion.audit.log_success.call_args[1]["record_count"] == 1
+
+    def test_interior_rows_all_counted(self, ingestion, tmp_path):
+        """Empty-field and whitespace-only rows before the last data row still count."""
+        src = tmp_path / "interior.csv"
+        src.write_text(
+            "code_insee_region,puissance_installee_mw\n11,100\n,\n   \n24,200\n",
+            encoding="utf-8",
+        )
+        ingestion.ingest_file(src)
+        assert ingestion.audit.log_success.call_args[1]["record_count"] == 4
+
+    def test_all_empty_fields_row_is_data(self, ingestion, tmp_path):
+        """A row of empty fields is a data row, as before."""
+        src = tmp_path / "empty_fields.csv"
+        src.write_text("code_insee_region,puissance_installee_mw\n,\n", encoding="utf-8")
+        ingestion.ingest_file(src)
+        assert ingestion.audit.log_success.call_args[1]["record_count"] == 1
+
     def test_bronze_path_convention(self, ingestion, sample_csv_path, tmp_path):
         """Path follows reference/capacity/YYYY/MM/ convention."""
         ingestion.ingest_file(sample_csv_path)
         capacity_files = list(tmp_path.rglob("*.csv"))
-        path_str = str(capacity_files[0])
-        assert "reference/capacity/" in path_str
+        assert capacity_files == [_bronze_path(ingestion)]
+        assert "reference/capacity/" in str(capacity_files[0])
 
 
 class TestCSVIngestionErrors:
@@ -76,6 +143,16 @@ class TestCSVIngestionErrors:
         result = ingestion.ingest_file(headers_only)  # noqa: F841
         ingestion.audit.log_failure.assert_called_once()
 
+    def test_headers_then_blank_lines(self, ingestion, tmp_path):
+        """Whitespace-only lines after the header do not count as data."""
+        blank_rows = tmp_path / "blank_rows.csv"
+        blank_rows.write_text(
+            "code_insee_region,puissance_installee_mw\n   \n", encoding="utf-8"
+        )
+        ingestion.ingest_file(blank_rows)
+        ingestion.audit.log_failure.assert_called_once()
+        assert "no data rows" in ingestion.audit.log_failure.call_args[1]["error"]
+
     def test_missing_required_column(self, ingestion, tmp_path):
         """CSV without required columns fails."""
         bad_csv = tmp_path / "bad_columns.csv"
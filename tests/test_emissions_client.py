@@ -1,28 +1,57 @@
 """Tests for emissions_client.py — Story 2.3, Task 3"""
 
+import shutil
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
 import pytest
+import requests
 
 from functions.shared.bronze_storage import BronzeStorage
 from functions.shared.emissions_client import EmissionsClient
 
 
 FIXTURE_PATH = Path("tests/fixtures/emission_factors_sample.csv")
+_FIXTURE_TEXT = FIXTURE_PATH.read_text(encoding="utf-8")
 
 
-@pytest.fixture
-def local_storage(tmp_path):
-    return BronzeStorage(local_mode=True, local_root=str(tmp_path))
+class StubAudit:
+    """Minimal AuditLogger stand-in that records calls."""
 
+    def __init__(self):
+        self.log_success_calls = []
+        self.log_failure_calls = []
 
-@pytest.fixture
+    def log_success(self, **kwargs):
+        self.log_success_calls.append(kwargs)
+        return {"status": "success"}
+
+    def log_failure(self, **kwargs):
+        self.log_failure_calls.append(kwargs)
+        return {"status": "failure"}
+
+
+@pytest.fixture(scope="module")
+def bronze_root(tmp_path_factory):
+    return tmp_path_factory.mktemp("bronze")
+
+
+@pytest.fixture(scope="module")
+def local_storage(bronze_root):
+    return BronzeStorage(local_mode=True, local_root=str(bronze_root))
+
+
+@pytest.fixture(scope="module")
 def client(local_storage):
-    audit = MagicMock()
-    audit.log_success.return_value = {"status": "success"}
-    audit.log_failure.return_value = {"status": "failure"}
-    return EmissionsClient(bronze_storage=local_storage, audit_logger=audit)
+    """One EmissionsClient (and requests.Session) for the whole module."""
+    return EmissionsClient(bronze_storage=local_storage, audit_logger=StubAudit())
+
+
+@pytest.fixture(autouse=True)
+def _reset(client, bronze_root):
+    """Isolate tests: fresh audit call history and no emissions data/checkpoint."""
+    client.audit = StubAudit()
+    shutil.rmtree(bronze_root / "reference" / "emissions", ignore_errors=True)
 
 
 class TestEmissionsIngestion:
@@ -34,27 +63,25 @@ class TestEmissionsIngestion:
         assert result["status"] == "success"
         assert result["record_count"] == 12
 
-    def test_raw_content_preserved(self, client, tmp_path):
+    def test_raw_content_preserved(self, client):
         """AC #2: Original CSV format preserved in Bronze."""
-        client.ingest_from_file(FIXTURE_PATH)
-        output_files = list(tmp_path.rglob("*.csv"))
-        assert len(output_files) == 1
-        content = output_files[0].read_text(encoding="utf-8")
+        result = client.ingest_from_file(FIXTURE_PATH)
+        content = Path(result["path"]).read_text(encoding="utf-8")
         assert "facteur_emission_co2_kg_mwh" in content
         assert "nucleaire" in content
         assert "gaz_naturel" in content
 
-    def test_bronze_path_convention(self, client, tmp_path):
+    def test_bronze_path_convention(self, client, bronze_root):
         """Stored in reference/emissions/YYYY/ path."""
-        client.ingest_from_file(FIXTURE_PATH)
-        output_files = list(tmp_path.rglob("*.csv"))
-        path_str = str(output_files[0])
-        assert "reference/emissions/" in path_str
+        result = client.ingest_from_file(FIXTURE_PATH)
+        output_files = list(bronze_root.rglob("*.csv"))
+        assert [str(f) for f in output_files] == [result["path"]]
+        assert "reference/emissions/" in result["path"]
 
     def test_audit_logged(self, client):
         """Audit logger called on success."""
         client.ingest_from_file(FIXTURE_PATH)
-        client.audit.log_success.assert_called_once()
+        assert len(client.audit.log_success_calls) == 1
 
 
 class TestConditionalFetch:
@@ -75,7 +102,7 @@ class TestConditionalFetch:
 
         # Create modified file
         modified = tmp_path / "modified.csv"
-        content = FIXTURE_PATH.read_text() + "\nnouvelle,source,999.0,0.0,0.0,TEST,2025,2025-06-01\n"
+        content = _FIXTURE_TEXT + "\nnouvelle,source,999.0,0.0,0.0,TEST,2025,2025-06-01\n"
         modified.write_text(content, encoding="utf-8")
 
         result = client.ingest_from_file(modified)
@@ -86,28 +113,26 @@ class TestConditionalFetch:
 class TestHTTPDownload:
     """Test URL-based download with mocked HTTP."""
 
-    def test_ingest_from_url_success(self, client):
+    def test_ingest_from_url_success(self, client, monkeypatch):
         """Successful HTTP download stores data."""
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.text = FIXTURE_PATH.read_text()
-        mock_resp.raise_for_status = MagicMock()
+        resp = SimpleNamespace(
+            status_code=200, text=_FIXTURE_TEXT, raise_for_status=lambda: None
+        )
+        monkeypatch.setattr(client.session, "get", lambda *a, **kw: resp)
 
-        with patch.object(client.session, "get", return_value=mock_resp):
-            result = client.ingest_from_url("https://example.com/data.csv")
+        result = client.ingest_from_url("https://example.com/data.csv")
 
         assert result["status"] == "success"
         assert result["record_count"] == 12
 
-    def test_ingest_from_url_error(self, client):
+    def test_ingest_from_url_error(self, client, monkeypatch):
         """HTTP error returns failure."""
-        import requests
+        def refuse(*args, **kwargs):
+            raise requests.RequestException("Connection refused")
+
+        monkeypatch.setattr(client.session, "get", refuse)
 
-        with patch.object(
-            client.session, "get",
-            side_effect=requests.RequestException("Connection refused"),
-        ):
-            result = client.ingest_from_url("https://example.com/data.csv")
+        result = client.ingest_from_url("https://example.com/data.csv")
 
         assert result["status"] == "failure"
-        client.audit.log_failure.assert_called_once()
+        assert len(client.audit.log_failure_calls) == 1
@@ -2,72 +2,95 @@
 
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import polars as pl
 import pytest
 
 from functions.shared.era5_ingestion import ERA5Ingestion
 
+pytestmark = pytest.mark.polars
+
 
 FIXTURE_PATH = Path("tests/fixtures/era5_sample.parquet")
 
 
-@pytest.fixture
-def ingestion():
-    return ERA5Ingestion()
+@pytest.fixture(scope="module")
+def ingested(tmp_path_factory):
+    """Ingest the fixture once; tests share the written output."""
+    outdir = tmp_path_factory.mktemp("era5")
+    audit = MagicMock()
+    result = ERA5Ingestion(audit_logger=audit).ingest_parquet(FIXTURE_PATH, output_dir=outdir)
+    files = [Path(p) for p in result["paths"]]
+    return {
+        "result": result,
+        "files": files,
+        "root": outdir,
+        "audit": audit,
+    }
 
 
 class TestERA5Ingestion:
     """AC #1, #2: Parquet ingestion with Polars streaming."""
 
-    def test_ingest_parquet(self, ingestion, tmp_path):
+    def test_ingest_parquet(self, ingested):
         """AC #1: ERA5 Parquet data is ingested and partitioned."""
-        result = ingestion.ingest_parquet(FIXTURE_PATH, output_dir=tmp_path)
+        result = ingested["result"]
         assert result["total_rows"] == 144
         assert result["files_written"] > 0
         assert len(result["regions_processed"]) > 0
 
-    def test_wind_speed_computed(self, ingestion, tmp_path):
-        """Derived wind_speed_100m is computed from u100/v100."""
-        ingestion.ingest_parquet(FIXTURE_PATH, output_dir=tmp_path)
-        output_files = list(tmp_path.rglob("*.parquet"))
-        assert len(output_files) > 0
-
-        df = pl.read_parquet(output_files[0])
-        assert "wind_speed_100m" in df.columns
-        assert float(df["wind_speed_100m"].min()) >= 0  # type: ignore[arg-type]
+    def test_audit_details_omit_paths(self, ingested):
+        """Heartbeat carries the summary counts but not the written paths."""
+        details = ingested["audit"].log_success.call_args[1]["details"]["era5"]
+        assert "paths" not in details
+        assert details["files_written"] == ingested["result"]["files_written"]
 
-    def test_temperature_celsius(self, ingestion, tmp_path):
+    def test_wind_speed_computed(self, ingested):
+        """Derived wind_speed_100m is computed from u100/v100."""
+        assert len(ingested["files"]) > 0
+        lf = pl.scan_parquet(ingested["files"][0])
+        assert "wind_speed_100m" in lf.collect_schema().names()
+
+        lo = (
+            lf.select(pl.col("wind_speed_100m").min())
+            .collect()
+            .item()
+        )
+        assert lo >= 0
+
+    def test_temperature_celsius(self, ingested):
         """Temperature converted from Kelvin to Celsius."""
-        ingestion.ingest_parquet(FIXTURE_PATH, output_dir=tmp_path)
-        output_files = list(tmp_path.rglob("*.parquet"))
-        df = pl.read_parquet(output_files[0])
-        assert "temperature_c" in df.columns
+        lf = pl.scan_parquet(ingested["files"][0])
+        assert "temperature_c" in lf.collect_schema().names()
         # Original t2m is ~285-310K → ~12-37°C
-        assert float(df["temperature_c"].min()) > -50  # type: ignore[arg-type]
-        assert float(df["temperature_c"].max()) < 60  # type: ignore[arg-type]
-
-    def test_region_mapping(self, ingestion, tmp_path):
+        bounds = lf.select(
+            pl.col("temperature_c").min().alias("lo"),
+            pl.col("temperature_c").max().alias("hi"),
+        ).collect()
+        assert bounds["lo"].item() > -50
+        assert bounds["hi"].item() < 60
+
+    def test_region_mapping(self, ingested):
         """Grid points are mapped to nearest French regions."""
-        ingestion.ingest_parquet(FIXTURE_PATH, output_dir=tmp_path)
-        output_files = list(tmp_path.rglob("*.parquet"))
-        df = pl.read_parquet(output_files[0])
-        assert "region_code" in df.columns
+        schema = pl.scan_parquet(ingested["files"][0]).collect_schema()
+        assert "region_code" in schema.names()
 
-    def test_partitioned_by_region_month(self, ingestion, tmp_path):
+    def test_partitioned_by_region_month(self, ingested):
         """Output follows climate/era5/YYYY/MM/ path convention."""
-        ingestion.ingest_parquet(FIXTURE_PATH, output_dir=tmp_path)
-        output_files = list(tmp_path.rglob("*.parquet"))
+        root = ingested["root"]
+        output_files = list(root.rglob("*.parquet"))
+        assert sorted(output_files) == sorted(ingested["files"])
+        assert ingested["result"]["files_written"] == len(output_files)
         for f in output_files:
-            parts = str(f.relative_to(tmp_path))
+            parts = str(f.relative_to(root))
             assert "climate/era5/" in parts
 
-    def test_streaming_mode(self, ingestion, tmp_path):
+    def test_streaming_mode(self, ingested):
         """AC #2: scan_parquet uses lazy evaluation (no OOM on large files)."""
         # This test verifies that the code path uses scan_parquet
         # The fixture is small, but the code path is the same for large files
-        result = ingestion.ingest_parquet(FIXTURE_PATH, output_dir=tmp_path)
-        assert result["total_rows"] > 0  # completed without error
+        assert ingested["result"]["total_rows"] > 0  # completed without error
 
 
 class TestCheckpoint:
@@ -10,24 +10,47 @@ import pytest
 from functions.shared.gold.dim_loader import DimLoader
 from functions.shared.gold.fact_loader import FactLoader
 
+pytestmark = [pytest.mark.polars, pytest.mark.sqlite]
 
-@pytest.fixture
-def db():
-    """In-memory SQLite with Gold Star Schema."""
+
+def _connect() -> sqlite3.Connection:
     conn = sqlite3.connect(":memory:")
-    dim = DimLoader(conn)
-    dim.ensure_schema()
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
+@pytest.fixture(scope="module")
+def schema_template():
+    """Gold Star Schema built once per module."""
+    conn = _connect()
+    DimLoader(conn).ensure_schema()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def db(schema_template):
+    """
+    In-memory SQLite with Gold Star Schema — cloned from the module template.
+
+    Loaders commit internally, which would release a per-test SAVEPOINT, so each
+    test gets its own page-level copy via the backup API instead of rebuilding DDL.
+    """
+    conn = _connect()
+    schema_template.backup(conn)
+    yield conn
+    conn.close()
+
+
 @pytest.fixture
 def dim(db):
     return DimLoader(db)
 
 
-@pytest.fixture
-def silver_parquet(tmp_path):
-    """Create a Silver Parquet fixture for Gold loading."""
+@pytest.fixture(scope="session")
+def silver_parquet(tmp_path_factory):
+    """Create a Silver Parquet fixture for Gold loading (once — FactLoader only reads it)."""
     df = pl.DataFrame([
         {
             "code_insee_region": "11",
@@ -56,8 +79,8 @@ def silver_parquet(tmp_path):
             "bioenergies_mw": 30.0,
         },
     ])
-    path = tmp_path / "silver.parquet"
-    df.write_parquet(path)
+    path = tmp_path_factory.mktemp("silver") / "silver.parquet"
+    df.write_parquet(path, compression="uncompressed", statistics=False, row_group_size=2)
     return path
 
 
@@ -77,9 +100,10 @@ class TestDimLoader:
         """AC #3: Upsert is idempotent — re-run doesn't duplicate."""
         dim.upsert_regions([{"code_insee": "11", "nom_region": "IDF"}])
         dim.upsert_regions([{"code_insee": "11", "nom_region": "Île-de-France"}])
-        cursor = dim.conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM DIM_REGION WHERE code_insee = '11'")
-        assert cursor.fetchone()[0] == 1
+        row = dim.conn.execute(
+            "SELECT COUNT(*) FROM DIM_REGION WHERE code_insee = '11'"
+        ).fetchone()
+        assert row[0] == 1
 
     def test_upsert_time(self, dim):
         count = dim.upsert_time(["2025-06-15T10:00:00+00:00"])
@@ -95,9 +119,10 @@ class TestDimLoader:
     def test_weekend_detection(self, dim):
         """DIM_TIME correctly flags weekends."""
         dim.upsert_time(["2025-06-15T10:00:00+00:00"])  # Sunday
-        cursor = dim.conn.cursor()
-        cursor.execute("SELECT est_weekend FROM DIM_TIME WHERE horodatage = '2025-06-15T10:00:00+00:00'")
-        assert cursor.fetchone()[0] == 1
+        row = dim.conn.execute(
+            "SELECT est_weekend FROM DIM_TIME WHERE horodatage = '2025-06-15T10:00:00+00:00'"
+        ).fetchone()
+        assert row[0] == 1
 
 
 # ─── Fact Loader Tests ───────────────────────────────────────────────────────
@@ -117,6 +142,7 @@ class TestFactLoader:
         # 2 regions × 8 source columns (some 0) = up to 16 rows
         count = loader.get_fact_count()
         assert count > 0
+        assert count == db.execute("SELECT COUNT(*) FROM FACT_ENERGY_FLOW").fetchone()[0]
 
     def test_facteur_charge(self, db, silver_parquet):
         """Load factor calculated when capacity data provided."""
@@ -124,14 +150,12 @@ class TestFactLoader:
         loader = FactLoader(db, capacity_data=capacity)
         loader.load_from_silver(silver_parquet)
 
-        cursor = db.cursor()
-        cursor.execute(
+        rows = db.execute(
             """SELECT f.facteur_charge
                FROM FACT_ENERGY_FLOW f
                JOIN DIM_SOURCE s ON f.id_source = s.id_source
                WHERE s.source_name = 'nucleaire' AND f.facteur_charge IS NOT NULL"""
-        )
-        rows = cursor.fetchall()
+        ).fetchall()
         assert len(rows) > 0
         # 3200 / 10000 = 0.32
         assert any(abs(r[0] - 0.32) < 0.01 for r in rows)
@@ -141,15 +165,17 @@ class TestFactLoader:
         loader = FactLoader(db)
         loader.load_from_silver(silver_parquet)
 
-        cursor = db.cursor()
         # All FK references should be valid
-        cursor.execute("""
+        row = db.execute("""
             SELECT COUNT(*) FROM FACT_ENERGY_FLOW f
-            WHERE f.id_region NOT IN (SELECT id_region FROM DIM_REGION)
-               OR f.id_source NOT IN (SELECT id_source FROM DIM_SOURCE)
-               OR f.id_date NOT IN (SELECT id_date FROM DIM_TIME)
-        """)
-        assert cursor.fetchone()[0] == 0
+            LEFT JOIN DIM_REGION r ON f.id_region = r.id_region
+            LEFT JOIN DIM_SOURCE s ON f.id_source = s.id_source
+            LEFT JOIN DIM_TIME t ON f.id_date = t.id_date
+            WHERE r.id_region IS NULL
+               OR s.id_source IS NULL
+               OR t.id_date IS NULL
+        """).fetchone()
+        assert row[0] == 0
 
     def test_idempotent_load(self, db, silver_parquet):
         """Reload same data doesn't create duplicates (ON CONFLICT)."""
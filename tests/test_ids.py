@@ -0,0 +1,13 @@
+"""Tests for ids.py"""
+
+import uuid
+
+from functions.shared.ids import fast_uuid4
+
+
+class TestFastUUID4:
+    def test_unique(self):
+        assert len({fast_uuid4() for _ in range(1000)}) == 1000
+
+    def test_variant_bits(self):
+        assert uuid.UUID(fast_uuid4()).variant == uuid.RFC_4122
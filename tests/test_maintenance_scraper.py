@@ -1,7 +1,7 @@
 """Tests for maintenance_scraper.py — Story 2.1, Task 4"""
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
 import pytest
 
@@ -9,6 +9,7 @@ from functions.shared.maintenance_scraper import MaintenanceScraper, ScraperErro
 
 
 FIXTURE_PATH = Path("tests/fixtures/rte_maintenance_page.html")
+_FIXTURE_TEXT = FIXTURE_PATH.read_text(encoding="utf-8")
 
 
 @pytest.fixture
@@ -16,17 +17,21 @@ def scraper():
     return MaintenanceScraper()
 
 
+@pytest.fixture(scope="session")
+def events():
+    """Fixture page parsed once; tests must not mutate the events."""
+    return MaintenanceScraper().scrape_from_file(FIXTURE_PATH)
+
+
 class TestParseHTML:
     """AC #1, #2, #4: HTML parsing extracts structured maintenance events."""
 
-    def test_parse_fixture(self, scraper):
+    def test_parse_fixture(self, events):
         """All 6 events are extracted from fixture."""
-        events = scraper.scrape_from_file(FIXTURE_PATH)
         assert len(events) == 6
 
-    def test_event_structure(self, scraper):
+    def test_event_structure(self, events):
         """Each event has required fields (AC #2)."""
-        events = scraper.scrape_from_file(FIXTURE_PATH)
         required_fields = {
             "event_id", "start_date", "end_date", "description",
             "affected_area", "source_url", "scraped_at",
@@ -35,36 +40,31 @@ class TestParseHTML:
             for field in required_fields:
                 assert field in event, f"Missing field: {field}"
 
-    def test_event_id_extraction(self, scraper):
+    def test_event_id_extraction(self, events):
         """Event IDs are correctly parsed."""
-        events = scraper.scrape_from_file(FIXTURE_PATH)
         ids = [e["event_id"] for e in events]
         assert "EVT-2026-001" in ids
         assert "EVT-2026-006" in ids
 
-    def test_mw_parsing(self, scraper):
+    def test_mw_parsing(self, events):
         """MW values are parsed as floats."""
-        events = scraper.scrape_from_file(FIXTURE_PATH)
         gravelines = next(e for e in events if e["event_id"] == "EVT-2026-001")
         assert gravelines["unavailable_mw"] == 910.0
 
-    def test_area_extraction(self, scraper):
+    def test_area_extraction(self, events):
         """Affected areas are correctly parsed."""
-        events = scraper.scrape_from_file(FIXTURE_PATH)
         areas = {e["affected_area"] for e in events}
         assert "Normandie" in areas
         assert "Grand Est" in areas
 
-    def test_event_types(self, scraper):
+    def test_event_types(self, events):
         """Event types (Planifiée/Fortuite) are parsed."""
-        events = scraper.scrape_from_file(FIXTURE_PATH)
         types = {e["event_type"] for e in events}
         assert "Planifiée" in types
         assert "Fortuite" in types
 
-    def test_scraped_at_present(self, scraper):
+    def test_scraped_at_present(self, events):
         """Each event has scraped_at timestamp."""
-        events = scraper.scrape_from_file(FIXTURE_PATH)
         for event in events:
             assert event["scraped_at"]  # non-empty
 
@@ -72,32 +72,33 @@ class TestParseHTML:
 class TestErrorHandling:
     """AC #3: HTTP errors handled gracefully."""
 
-    def test_404_raises(self, scraper):
+    def test_404_raises(self, scraper, monkeypatch):
         """Non-retryable 404 raises ScraperError."""
-        mock_resp = MagicMock()
-        mock_resp.status_code = 404
-        mock_resp.text = "Not Found"
+        resp = SimpleNamespace(status_code=404, text="Not Found")
+        monkeypatch.setattr(scraper.session, "get", lambda *a, **kw: resp)
 
-        with patch.object(scraper.session, "get", return_value=mock_resp):
-            with pytest.raises(ScraperError, match="404"):
-                scraper.scrape_from_url("https://example.com")
+        with pytest.raises(ScraperError, match="404"):
+            scraper.scrape_from_url("https://example.com")
 
-    def test_429_retries(self, scraper):
+    def test_429_retries(self, scraper, monkeypatch):
         """Retryable 429 triggers retry then succeeds."""
-        mock_429 = MagicMock()
-        mock_429.status_code = 429
+        calls = [0]
+
+        def fake_get(*args, **kwargs):
+            calls[0] += 1
+            if calls[0] == 1:
+                return SimpleNamespace(status_code=429, text="")
+            return SimpleNamespace(status_code=200, text=_FIXTURE_TEXT)
 
-        mock_200 = MagicMock()
-        mock_200.status_code = 200
-        mock_200.text = FIXTURE_PATH.read_text()
+        monkeypatch.setattr(scraper.session, "get", fake_get)
+        monkeypatch.setattr(
+            "functions.shared.maintenance_scraper.time.sleep", lambda *_: None
+        )
 
-        with patch.object(
-            scraper.session, "get", side_effect=[mock_429, mock_200]
-        ):
-            with patch("functions.shared.maintenance_scraper.time.sleep"):
-                events = scraper.scrape_from_url("https://example.com")
+        events = scraper.scrape_from_url("https://example.com")
 
         assert len(events) == 6
+        assert calls[0] == 2
 
     def test_no_url_raises(self):
         """Scraping without URL raises ScraperError."""
@@ -25,13 +25,27 @@ from functions.shared.api.routes import (
 )
 
 
-# ─── Fixture ─────────────────────────────────────────────────────────────────
+# ─── Fixtures ────────────────────────────────────────────────────────────────
 
 @pytest.fixture(scope="module")
 def spec() -> dict:
     return build_spec()
 
 
+@pytest.fixture(scope="module")
+def param_names(spec) -> dict[str, set[str]]:
+    """Path → set of GET query parameter names."""
+    return {
+        path: {p["name"] for p in item.get("get", {}).get("parameters", [])}
+        for path, item in spec["paths"].items()
+    }
+
+
+@pytest.fixture(scope="module")
+def swagger_html() -> str:
+    return build_swagger_ui_html()
+
+
 # ─── Task 4.1: OpenAPI 3.0 structural validation ─────────────────────────────
 
 class TestSpecStructure:
@@ -94,33 +108,21 @@ class TestSpecStructure:
 class TestEndpointCoverage:
     """AC #1: /health, /v1/production/regional, /v1/export/csv all documented."""
 
-    def test_health_endpoint_in_spec(self, spec):
-        assert "/health" in spec["paths"]
-
-    def test_production_endpoint_in_spec(self, spec):
-        assert "/v1/production/regional" in spec["paths"]
-
-    def test_export_endpoint_in_spec(self, spec):
-        assert "/v1/export/csv" in spec["paths"]
+    @pytest.mark.parametrize("path", ["/health", "/v1/production/regional", "/v1/export/csv"])
+    def test_endpoint_present_with_get(self, spec, path):
+        assert path in spec["paths"]
+        assert "get" in spec["paths"][path], f"GET missing for {path}"
 
-    def test_all_paths_have_get(self, spec):
-        for path in ["/health", "/v1/production/regional", "/v1/export/csv"]:
-            assert "get" in spec["paths"][path], f"GET missing for {path}"
-
-    def test_production_has_all_query_params(self, spec):
+    def test_production_has_all_query_params(self, param_names):
         """AC #2: All documented params match the implementation."""
-        params = spec["paths"]["/v1/production/regional"]["get"]["parameters"]
-        param_names = {p["name"] for p in params}
         expected = {"region_code", "start_date", "end_date", "source_type", "limit", "offset"}
-        assert expected == param_names
+        assert expected == param_names["/v1/production/regional"]
 
-    def test_export_has_query_params_no_pagination(self, spec):
+    def test_export_has_query_params_no_pagination(self, param_names):
         """AC #2: Export params — no limit/offset (full export)."""
-        params = spec["paths"]["/v1/export/csv"]["get"]["parameters"]
-        param_names = {p["name"] for p in params}
-        assert "region_code" in param_names
-        assert "limit" not in param_names
-        assert "offset" not in param_names
+        export_params = param_names["/v1/export/csv"]
+        assert "region_code" in export_params
+        assert not export_params & {"limit", "offset"}
 
     def test_params_have_schema_and_description(self, spec):
         """AC #2: Each param has a type and description."""
@@ -144,11 +146,11 @@ class TestEndpointCoverage:
         resp_200 = spec["paths"]["/v1/export/csv"]["get"]["responses"]["200"]
         assert "text/csv" in resp_200["content"]
 
-    def test_error_responses_defined(self, spec):
+    @pytest.mark.parametrize("code", ["400", "401", "404", "500"])
+    def test_error_responses_defined(self, spec, code):
         """AC #2: 400, 401, 404, 500 documented on production endpoint."""
         responses = spec["paths"]["/v1/production/regional"]["get"]["responses"]
-        for code in ["400", "401", "404", "500"]:
-            assert code in responses, f"HTTP {code} not documented"
+        assert code in responses, f"HTTP {code} not documented"
 
     def test_error_response_schema_defined(self, spec):
         schemas = spec["components"]["schemas"]
@@ -214,39 +216,21 @@ class TestSecurityDocumentation:
 class TestSwaggerUI:
     """AC #1: Swagger UI HTML is valid and points to spec URL."""
 
-    def test_swagger_ui_returns_html(self):
-        html = build_swagger_ui_html()
-        assert "<!DOCTYPE html>" in html
-        assert "<html" in html
-
-    def test_swagger_ui_loads_cdn(self):
-        html = build_swagger_ui_html()
-        assert "unpkg.com/swagger-ui-dist" in html
-
-    def test_swagger_ui_points_to_spec_url(self):
-        html = build_swagger_ui_html(openapi_json_url="/api/openapi.json")
-        assert "/api/openapi.json" in html
-
-    def test_swagger_ui_custom_spec_url(self):
-        html = build_swagger_ui_html(openapi_json_url="/custom/spec.json")
-        assert "/custom/spec.json" in html
-
-    def test_swagger_ui_has_title(self):
-        html = build_swagger_ui_html()
-        assert API_TITLE in html
-
-    def test_swagger_ui_has_swagger_bundle_js(self):
-        html = build_swagger_ui_html()
-        assert "swagger-ui-bundle.js" in html
-
-    def test_swagger_ui_has_swagger_css(self):
-        html = build_swagger_ui_html()
-        assert "swagger-ui.css" in html
-
-    def test_swagger_ui_has_dom_target(self):
-        """Swagger UI needs a mount point."""
-        html = build_swagger_ui_html()
-        assert "swagger-ui" in html
+    @pytest.mark.parametrize("fragment", [
+        "<!DOCTYPE html>",
+        "<html",
+        "unpkg.com/swagger-ui-dist",   # CDN assets
+        API_TITLE,
+        "swagger-ui-bundle.js",
+        "swagger-ui.css",
+        "swagger-ui",                  # DOM mount point
+    ])
+    def test_swagger_ui_contains(self, swagger_html, fragment):
+        assert fragment in swagger_html
+
+    @pytest.mark.parametrize("url", ["/api/openapi.json", "/custom/spec.json"])
+    def test_swagger_ui_url(self, url):
+        assert url in build_swagger_ui_html(openapi_json_url=url)
 
 
 # ─── Routes: public/protected classification ─────────────────────────────────
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import polars as pl
+import pyarrow as pa
 import pytest
 
 from functions.shared.gold.dim_loader import DimLoader
@@ -17,38 +18,41 @@ from functions.shared.quality.checks import (  # type: ignore
 )
 from functions.shared.quality.gate_runner import GateRunner  # type: ignore
 
+pytestmark = pytest.mark.sqlite
+
 
 CONFIG_PATH = Path("config/quality_gates.json")
+TS_SCHEMA = {"ts": pl.Datetime("us", "UTC")}
 
 
 # ─── Individual Checks ──────────────────────────────────────────────────────
 
 class TestNullCheck:
     def test_pass_no_nulls(self):
-        df = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        df = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}, schema={"a": pl.Int64, "b": pl.Utf8})
         result = null_check(df, ["a", "b"])
         assert result["status"] == "PASS"
 
     def test_fail_with_nulls(self):
-        df = pl.DataFrame({"a": [1, None, 3], "b": ["x", "y", None]})
+        df = pl.DataFrame({"a": [1, None, 3], "b": ["x", "y", None]}, schema={"a": pl.Int64, "b": pl.Utf8})
         result = null_check(df, ["a", "b"])
         assert result["status"] == "FAIL"
         assert result["details"]["nulls_found"]["a"] == 1
 
     def test_missing_column(self):
-        df = pl.DataFrame({"a": [1, 2]})
+        df = pl.DataFrame({"a": [1, 2]}, schema={"a": pl.Int64})
         result = null_check(df, ["nonexistent"])
         assert result["status"] == "FAIL"
 
 
 class TestRangeCheck:
     def test_pass_in_range(self):
-        df = pl.DataFrame({"mw": [100.0, 5000.0, 50000.0]})
+        df = pl.DataFrame({"mw": [100.0, 5000.0, 50000.0]}, schema={"mw": pl.Float64})
         result = range_check(df, "mw", 0, 100000)
         assert result["status"] == "PASS"
 
     def test_fail_out_of_range(self):
-        df = pl.DataFrame({"mw": [100.0, -50.0, 200000.0]})
+        df = pl.DataFrame({"mw": [100.0, -50.0, 200000.0]}, schema={"mw": pl.Float64})
         result = range_check(df, "mw", 0, 100000)
         assert result["status"] == "FAIL"
         assert result["details"]["out_of_range_count"] == 2
@@ -71,52 +75,61 @@ class TestRowCountCheck:
 class TestFreshnessCheck:
     def test_pass_fresh_data(self):
         now = datetime.now(timezone.utc)
-        df = pl.DataFrame({"ts": [now - timedelta(hours=2)]})
+        df = pl.DataFrame({"ts": [now - timedelta(hours=2)]}, schema=TS_SCHEMA)
         result = freshness_check(df, "ts", max_age_hours=24, reference_time=now)
         assert result["status"] == "PASS"
 
     def test_fail_stale_data(self):
         now = datetime.now(timezone.utc)
-        df = pl.DataFrame({"ts": [now - timedelta(days=5)]})
+        df = pl.DataFrame({"ts": [now - timedelta(days=5)]}, schema=TS_SCHEMA)
         result = freshness_check(df, "ts", max_age_hours=24, reference_time=now)
         assert result["status"] == "FAIL"
 
 
-class TestFKIntegrity:
-    def test_pass_valid_fks(self):
-        conn = sqlite3.connect(":memory:")
-        dim = DimLoader(conn)
-        dim.ensure_schema()
-        dim.upsert_sources()
-        dim.upsert_regions([{"code_insee": "11", "nom_region": "IDF"}])
-        dim.upsert_time(["2025-06-15T10:00:00+00:00"])
+@pytest.fixture(scope="module")
+def seeded_template():
+    """Gold schema with seeded dimensions, built once per module."""
+    conn = sqlite3.connect(":memory:")
+    dim = DimLoader(conn)
+    dim.ensure_schema()
+    dim.upsert_sources()
+    dim.upsert_regions([{"code_insee": "11", "nom_region": "IDF"}])
+    dim.upsert_time(["2025-06-15T10:00:00+00:00"])
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def gold_db(seeded_template):
+    """Per-test copy of the seeded template via the SQLite backup API."""
+    conn = sqlite3.connect(":memory:")
+    seeded_template.backup(conn)
+    yield conn
+    conn.close()
 
+
+class TestFKIntegrity:
+    def test_pass_valid_fks(self, gold_db):
         # Insert a valid fact row
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO FACT_ENERGY_FLOW (id_date, id_region, id_source, valeur_mw) VALUES (1, 1, 1, 100)"
-        )
-        conn.commit()
+        with gold_db:
+            gold_db.execute(
+                "INSERT INTO FACT_ENERGY_FLOW (id_date, id_region, id_source, valeur_mw) VALUES (1, 1, 1, 100)"
+            )
 
-        result = fk_integrity_check(conn, "FACT_ENERGY_FLOW", {
+        result = fk_integrity_check(gold_db, "FACT_ENERGY_FLOW", {
             "id_region": "DIM_REGION",
             "id_source": "DIM_SOURCE",
             "id_date": "DIM_TIME",
         })
         assert result["status"] == "PASS"
 
-    def test_fail_orphan_fks(self):
-        conn = sqlite3.connect(":memory:")
-        dim = DimLoader(conn)
-        dim.ensure_schema()
+    def test_fail_orphan_fks(self, gold_db):
+        with gold_db:
+            gold_db.execute(
+                "INSERT INTO FACT_ENERGY_FLOW (id_date, id_region, id_source, valeur_mw) VALUES (999, 999, 999, 100)"
+            )
 
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO FACT_ENERGY_FLOW (id_date, id_region, id_source, valeur_mw) VALUES (999, 999, 999, 100)"
-        )
-        conn.commit()
-
-        result = fk_integrity_check(conn, "FACT_ENERGY_FLOW", {
+        result = fk_integrity_check(gold_db, "FACT_ENERGY_FLOW", {
             "id_region": "DIM_REGION",
         })
         assert result["status"] == "FAIL"
@@ -124,15 +137,32 @@ class TestFKIntegrity:
 
 # ─── Gate Runner Tests ───────────────────────────────────────────────────────
 
-class TestGateRunner:
-    def test_run_programmatic(self):
-        """AC #1: Run checks programmatically."""
-        df = pl.DataFrame({
+@pytest.fixture(scope="session")
+def sample_rte_silver():
+    """Small RTE Silver frame backed by an Arrow table (GateRunner never mutates it)."""
+    return pl.from_arrow(pa.table(
+        {
             "code_insee_region": ["11", "84"],
             "date_heure": ["2025-06-15", "2025-06-15"],
             "consommation_mw": [8500.0, 5200.0],
-        })
+        },
+        schema=pa.schema([
+            ("code_insee_region", pa.string()),
+            ("date_heure", pa.string()),
+            ("consommation_mw", pa.float64()),
+        ]),
+    ))
 
+
+@pytest.fixture(scope="session")
+def gate_config():
+    """Gates config parsed once per session (None if the file is absent)."""
+    return GateRunner.load_config(CONFIG_PATH) if CONFIG_PATH.exists() else None
+
+
+class TestGateRunner:
+    def test_run_programmatic(self, sample_rte_silver):
+        """AC #1: Run checks programmatically."""
         runner = GateRunner()
         results = runner.run_checks([
             {"name": "null_test", "check": "null_check",
@@ -141,7 +171,7 @@ class TestGateRunner:
             {"name": "range_test", "check": "range_check",
              "column": "consommation_mw", "min": 0, "max": 100000,
              "severity": "WARNING"},
-        ], context={"df": df})
+        ], context={"df": sample_rte_silver})
 
         assert len(results) == 2
         assert all(r["status"] == "PASS" for r in results)
@@ -160,21 +190,53 @@ class TestGateRunner:
         assert summary["warned"] == 1
         assert summary["pipeline_should_halt"] is True
 
-    def test_config_driven(self):
+    def test_summary_no_critical_failure(self):
+        """Non-critical failures don't halt; statusless results still count in total."""
+        runner = GateRunner()
+        runner.results = [
+            {"status": "FAIL", "severity": "WARNING"},
+            {"status": "PASS", "severity": "CRITICAL"},
+            {"severity": "INFO"},
+        ]
+        summary = runner.get_summary()
+        assert summary == {
+            "total_checks": 3,
+            "passed": 1,
+            "failed": 1,
+            "warned": 0,
+            "pipeline_should_halt": False,
+        }
+
+    def test_config_driven(self, gate_config):
         """AC #3: Config-driven gate execution."""
-        if not CONFIG_PATH.exists():
+        if gate_config is None:
             pytest.skip("Config not found")
 
         df = pl.DataFrame({
             "code_insee_region": ["11"],
             "date_heure": [datetime.now(timezone.utc)],
             "consommation_mw": [8500.0],
+        }, schema={
+            "code_insee_region": pl.Utf8,
+            "date_heure": pl.Datetime("us", "UTC"),
+            "consommation_mw": pl.Float64,
         })
 
         runner = GateRunner()
-        results = runner.run_from_config(
-            CONFIG_PATH,
+        results = runner.run_from_parsed_config(
+            gate_config,
             context={"rte_production": df, "df": df},
         )
         # At minimum the Silver checks should run
         assert len(results) > 0
+
+    def test_config_path_matches_parsed(self, gate_config):
+        """run_from_config loads the file and runs the same gates."""
+        if gate_config is None:
+            pytest.skip("Config not found")
+
+        results = GateRunner().run_from_config(CONFIG_PATH)
+        assert [r["name"] for r in results] == [g["name"] for g in gate_config["gates"]]
+
+    def test_missing_config_runs_nothing(self, tmp_path):
+        assert GateRunner().run_from_config(tmp_path / "missing.json") == []
@@ -1,36 +1,68 @@
 """Tests for rte_client.py — Story 1.1, Task 2.4"""
 
 import json
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from functions.shared.rte_client import RTEClient, RTEClientError
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    HAS_ORJSON = False
 
-@pytest.fixture
+
+FIXTURE_PATH = Path("tests/fixtures/rte_eco2mix_regional_sample.json")
+
+
+class _FakeResponse:
+    """Minimal requests.Response stand-in: status, text and a JSON payload."""
+
+    __slots__ = ("status_code", "text", "_payload")
+
+    def __init__(self, status_code: int, payload=None, text: str = ""):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = text
+
+    def json(self):
+        return self._payload
+
+
+@pytest.fixture(scope="module")
 def client():
+    """Shared client — tests only patch session.get for the call's duration."""
     return RTEClient()
 
 
-@pytest.fixture
-def sample_response():
-    """Load fixture from Story 0.1."""
-    with open("tests/fixtures/rte_eco2mix_regional_sample.json") as f:
-        records = json.load(f)
+@pytest.fixture(scope="session")
+def rte_sample_bytes() -> bytes:
+    """Raw fixture from Story 0.1, read from disk once per session."""
+    return FIXTURE_PATH.read_bytes()
+
+
+@pytest.fixture(scope="module")
+def sample_response(rte_sample_bytes):
+    """Parsed fixture (shared read-only across the module)."""
+    records = orjson.loads(rte_sample_bytes) if HAS_ORJSON else json.loads(rte_sample_bytes)
     return {"total_count": len(records), "results": records}
 
 
 class TestFetchEco2mixRegional:
     """Test fetch_eco2mix_regional with various scenarios."""
 
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self, monkeypatch):
+        """Retry backoff never actually sleeps."""
+        monkeypatch.setattr("functions.shared.rte_client.time.sleep", lambda *a, **k: None)
+
     def test_success(self, client, sample_response):
         """AC #1: Successful API call returns records."""
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = sample_response
-
-        with patch.object(client.session, "get", return_value=mock_resp):
+        with patch.object(client.session, "get", return_value=_FakeResponse(200, sample_response)):
             result = client.fetch_eco2mix_regional()
 
         assert "results" in result
@@ -39,9 +71,7 @@ class TestFetchEco2mixRegional:
 
     def test_success_with_region_filter(self, client, sample_response):
         """Filter by region code."""
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = sample_response
+        mock_resp = _FakeResponse(200, sample_response)
 
         with patch.object(client.session, "get", return_value=mock_resp) as mock_get:
             client.fetch_eco2mix_regional(region_code="11")
@@ -51,39 +81,29 @@ class TestFetchEco2mixRegional:
 
     def test_429_retries_then_succeeds(self, client, sample_response):
         """AC #3: Retryable 429 triggers backoff then succeeds."""
-        mock_429 = MagicMock()
-        mock_429.status_code = 429
-
-        mock_200 = MagicMock()
-        mock_200.status_code = 200
-        mock_200.json.return_value = sample_response
+        mock_429 = _FakeResponse(429)
+        mock_200 = _FakeResponse(200, sample_response)
 
         with patch.object(
             client.session, "get", side_effect=[mock_429, mock_200]
         ):
-            with patch("functions.shared.rte_client.time.sleep"):
-                result = client.fetch_eco2mix_regional()
+            result = client.fetch_eco2mix_regional()
 
         assert result["total_count"] > 0
 
     def test_500_retries_exhausted(self, client):
         """AC #3: Max retries exhausted raises RTEClientError."""
-        mock_500 = MagicMock()
-        mock_500.status_code = 500
-        mock_500.text = "Internal Server Error"
+        mock_500 = _FakeResponse(500, text="Internal Server Error")
 
         with patch.object(
             client.session, "get", return_value=mock_500
         ):
-            with patch("functions.shared.rte_client.time.sleep"):
-                with pytest.raises(RTEClientError, match="Max retries"):
-                    client.fetch_eco2mix_regional()
+            with pytest.raises(RTEClientError, match="Max retries"):
+                client.fetch_eco2mix_regional()
 
     def test_400_no_retry(self, client):
         """Non-retryable 400 fails immediately."""
-        mock_400 = MagicMock()
-        mock_400.status_code = 400
-        mock_400.text = "Bad Request"
+        mock_400 = _FakeResponse(400, text="Bad Request")
 
         with patch.object(client.session, "get", return_value=mock_400):
             with pytest.raises(RTEClientError, match="Non-retryable"):
@@ -93,17 +113,14 @@ class TestFetchEco2mixRegional:
         """Network timeout triggers retry."""
         import requests
 
-        mock_200 = MagicMock()
-        mock_200.status_code = 200
-        mock_200.json.return_value = sample_response
+        mock_200 = _FakeResponse(200, sample_response)
 
         with patch.object(
             client.session,
             "get",
             side_effect=[requests.exceptions.Timeout, mock_200],
         ):
-            with patch("functions.shared.rte_client.time.sleep"):
-                result = client.fetch_eco2mix_regional()
+            result = client.fetch_eco2mix_regional()
 
         assert result["total_count"] > 0
 
@@ -16,201 +16,276 @@ from functions.shared.transformations.capacity_silver import transform_capacity_
 from functions.shared.transformations.maintenance_silver import transform_maintenance_to_silver
 from functions.shared.transformations.era5_silver import transform_era5_to_silver
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    HAS_ORJSON = False
+
+pytestmark = pytest.mark.polars
+
 
 FIXTURE_DIR = Path("tests/fixtures")
 
 
+def _dump_json(obj) -> bytes:
+    """Serialize fixture records to UTF-8 JSON, via orjson when available."""
+    return orjson.dumps(obj) if HAS_ORJSON else json.dumps(obj).encode("utf-8")
+
+
+def _silver_outputs(result: dict, out_dir: Path) -> dict:
+    """Transform summary plus its Parquet files, listed once for the class."""
+    parquets = sorted(out_dir.rglob("*.parquet"))
+    return {"result": result, "parquets": parquets, "first_parquet": parquets[0]}
+
+
 # ─── Data Quality Tests ─────────────────────────────────────────────────────
 
+def _apply_lazy(df, rules, source_name):
+    """Exercise the LazyFrame path; collect only at assertion time."""
+    result, metrics = apply_quality_rules(df.lazy(), rules, source_name)
+    assert isinstance(result, pl.LazyFrame)
+    return result.collect(), metrics
+
+
+@pytest.fixture(scope="class")
+def dq_frames():
+    """Base frames shared by TestDataQuality, grouped by row count.
+
+    Tests select the columns they need; Polars frames are immutable, so
+    sharing them across tests is safe.
+    """
+    return {
+        2: pl.DataFrame(
+            {"a": [1, None], "b": [None, 2]},
+            schema={"a": pl.Int64, "b": pl.Int64},
+        ),
+        3: pl.DataFrame(
+            {"key": ["a", None, "c"], "id": [1, 2, 3], "val": [1.0, None, 3.0]},
+            schema={"key": pl.Utf8, "id": pl.Int64, "val": pl.Float64},
+        ),
+        4: pl.DataFrame(
+            {
+                "key": ["a", None, "c", "d"],
+                "val": [1.0, None, None, 4.0],
+                "ff": [10.0, None, None, 20.0],
+            },
+            schema={"key": pl.Utf8, "val": pl.Float64, "ff": pl.Float64},
+        ),
+    }
+
+
 class TestDataQuality:
-    def test_fill_zero(self):
-        df = pl.DataFrame({"val": [1.0, None, 3.0]})
+    def test_fill_zero(self, dq_frames):
+        df = dq_frames[3].select("val")
         rules = {"val": NullStrategy.FILL_ZERO}
-        result, metrics = apply_quality_rules(df, rules, "test")
-        assert result["val"].to_list() == [1.0, 0.0, 3.0]
+        result, metrics = _apply_lazy(df, rules, "test")
+        assert result["val"].equals(pl.Series("val", [1.0, 0.0, 3.0]))
         assert metrics["values_filled"] == 1
 
-    def test_drop_rows(self):
-        df = pl.DataFrame({"key": ["a", None, "c"], "val": [1, 2, 3]})
+    def test_drop_rows(self, dq_frames):
+        df = dq_frames[3].select("key", "id")
         rules = {"key": NullStrategy.DROP}
-        result, metrics = apply_quality_rules(df, rules, "test")
+        result, metrics = _apply_lazy(df, rules, "test")
         assert len(result) == 2
         assert metrics["rows_dropped"] == 1
 
-    def test_flag_nulls(self):
-        df = pl.DataFrame({"val": [1.0, None, 3.0]})
+    def test_flag_nulls(self, dq_frames):
+        df = dq_frames[3].select("val")
         rules = {"val": NullStrategy.FLAG}
-        result, metrics = apply_quality_rules(df, rules, "test")
+        result, metrics = _apply_lazy(df, rules, "test")
         assert "val_is_null" in result.columns
-        assert result["val_is_null"].to_list() == [False, True, False]
+        assert result["val_is_null"].equals(pl.Series("val_is_null", [False, True, False]))
         assert metrics["values_flagged"] == 1
 
-    def test_forward_fill(self):
-        df = pl.DataFrame({"val": [10.0, None, None, 20.0]})
-        rules = {"val": NullStrategy.FORWARD_FILL}
-        result, _ = apply_quality_rules(df, rules, "test")
-        assert result["val"].to_list() == [10.0, 10.0, 10.0, 20.0]
+    def test_forward_fill(self, dq_frames):
+        df = dq_frames[4].select("ff")
+        rules = {"ff": NullStrategy.FORWARD_FILL}
+        result, _ = _apply_lazy(df, rules, "test")
+        assert result["ff"].equals(pl.Series("ff", [10.0, 10.0, 10.0, 20.0]))
 
-    def test_quality_metrics(self):
-        df = pl.DataFrame({"a": [1, None], "b": [None, 2]})
+    def test_quality_metrics(self, dq_frames):
         rules = {"a": NullStrategy.DROP, "b": NullStrategy.FILL_ZERO}
-        _, metrics = apply_quality_rules(df, rules, "test")
+        _, metrics = apply_quality_rules(dq_frames[2], rules, "test")
         assert metrics["input_rows"] == 2
         assert metrics["source"] == "test"
 
+    def test_eager_matches_lazy(self, dq_frames):
+        df = dq_frames[4].select("key", "val")
+        rules = {"key": NullStrategy.DROP, "val": NullStrategy.FLAG}
+        eager, eager_metrics = apply_quality_rules(df, rules, "test")
+        lazy, lazy_metrics = _apply_lazy(df, rules, "test")
+        assert isinstance(eager, pl.DataFrame)
+        assert eager.equals(lazy)
+        assert eager_metrics == lazy_metrics
+        assert eager_metrics["rows_dropped"] == 1
+        assert eager_metrics["values_flagged"] == 1
+
 
 # ─── RTE Silver Tests ───────────────────────────────────────────────────────
 
-class TestRTESilver:
-    @pytest.fixture
-    def bronze_json(self, tmp_path):
-        records = [
-            {
-                "code_insee_region": "11",
-                "libelle_region": "Île-de-France",
-                "date_heure": "2025-06-15T10:00:00+02:00",
-                "consommation": 8500,
-                "nucleaire": 3200,
-                "eolien": 450.0,
-                "solaire": 320,
-                "hydraulique": 180,
-                "gaz": 120,
-                "charbon": 0,
-                "fioul": 0,
-                "bioenergies": 45,
-                "pompage": "0",  # String type issue from Story 0.1
-            },
-            {
-                "code_insee_region": "11",
-                "libelle_region": "Île-de-France",
-                "date_heure": "2025-06-15T10:00:00+02:00",  # Duplicate!
-                "consommation": 8500,
-                "nucleaire": 3200,
-                "eolien": 450.0,
-                "solaire": 320,
-                "hydraulique": 180,
-                "gaz": 120,
-                "charbon": 0,
-                "fioul": 0,
-                "bioenergies": 45,
-                "pompage": "0",
-            },
-            {
-                "code_insee_region": "84",
-                "libelle_region": "Auvergne-Rhône-Alpes",
-                "date_heure": "2025-06-15T10:00:00+02:00",
-                "consommation": 5200,
-                "nucleaire": 2100,
-                "eolien": 280,
-                "solaire": 510,
-                "hydraulique": 890,
-                "gaz": 0,
-                "charbon": 0,
-                "fioul": 0,
-                "bioenergies": 30,
-                "pompage": 0,
-            },
-        ]
-        f = tmp_path / "bronze.json"
-        f.write_text(json.dumps(records), encoding="utf-8")
-        return f
+@pytest.fixture(scope="class")
+def rte_bronze_json(tmp_path_factory):
+    records = [
+        {
+            "code_insee_region": "11",
+            "libelle_region": "Île-de-France",
+            "date_heure": "2025-06-15T10:00:00+02:00",
+            "consommation": 8500,
+            "nucleaire": 3200,
+            "eolien": 450.0,
+            "solaire": 320,
+            "hydraulique": 180,
+            "gaz": 120,
+            "charbon": 0,
+            "fioul": 0,
+            "bioenergies": 45,
+            "pompage": "0",  # String type issue from Story 0.1
+        },
+        {
+            "code_insee_region": "11",
+            "libelle_region": "Île-de-France",
+            "date_heure": "2025-06-15T10:00:00+02:00",  # Duplicate!
+            "consommation": 8500,
+            "nucleaire": 3200,
+            "eolien": 450.0,
+            "solaire": 320,
+            "hydraulique": 180,
+            "gaz": 120,
+            "charbon": 0,
+            "fioul": 0,
+            "bioenergies": 45,
+            "pompage": "0",
+        },
+        {
+            "code_insee_region": "84",
+            "libelle_region": "Auvergne-Rhône-Alpes",
+            "date_heure": "2025-06-15T10:00:00+02:00",
+            "consommation": 5200,
+            "nucleaire": 2100,
+            "eolien": 280,
+            "solaire": 510,
+            "hydraulique": 890,
+            "gaz": 0,
+            "charbon": 0,
+            "fioul": 0,
+            "bioenergies": 30,
+            "pompage": 0,
+        },
+    ]
+    f = tmp_path_factory.mktemp("rte_bronze") / "bronze.json"
+    f.write_bytes(_dump_json(records))
+    return f
+
+
+@pytest.fixture(scope="class")
+def rte_silver_out(rte_bronze_json, tmp_path_factory):
+    """Run the transform once; tests share the result and output."""
+    out_dir = tmp_path_factory.mktemp("rte_silver")
+    result = transform_rte_to_silver(rte_bronze_json, out_dir)
+    return _silver_outputs(result, out_dir)
+
 
-    def test_rte_transform(self, bronze_json, tmp_path):
-        result = transform_rte_to_silver(bronze_json, tmp_path)
+class TestRTESilver:
+    def test_rte_transform(self, rte_silver_out):
+        result = rte_silver_out["result"]
         assert result["status"] == "success"
         assert result["output_rows"] == 2  # 1 dupe removed
 
-    def test_deduplication(self, bronze_json, tmp_path):
-        result = transform_rte_to_silver(bronze_json, tmp_path)
-        assert result["duplicates_removed"] == 1
+    def test_deduplication(self, rte_silver_out):
+        assert rte_silver_out["result"]["duplicates_removed"] == 1
 
-    def test_column_rename(self, bronze_json, tmp_path):
-        transform_rte_to_silver(bronze_json, tmp_path)
-        parquets = list(tmp_path.rglob("*.parquet"))
-        df = pl.read_parquet(parquets[0])
-        assert "consommation_mw" in df.columns
-        assert "nucleaire_mw" in df.columns
+    def test_column_rename(self, rte_silver_out):
+        schema = pl.scan_parquet(rte_silver_out["first_parquet"]).collect_schema()
+        assert "consommation_mw" in schema
+        assert "nucleaire_mw" in schema
 
-    def test_pompage_cast(self, bronze_json, tmp_path):
+    def test_pompage_cast(self, rte_silver_out):
         """Story 0.1 bug: pompage is sometimes str."""
-        transform_rte_to_silver(bronze_json, tmp_path)
-        parquets = list(tmp_path.rglob("*.parquet"))
-        df = pl.read_parquet(parquets[0])
-        assert df["pompage_mw"].dtype == pl.Float64
+        schema = pl.scan_parquet(rte_silver_out["first_parquet"]).collect_schema()
+        assert schema["pompage_mw"] == pl.Float64
 
-    def test_hive_partitioning(self, bronze_json, tmp_path):
-        transform_rte_to_silver(bronze_json, tmp_path)
-        parquets = list(tmp_path.rglob("*.parquet"))
-        assert any("year=" in str(p) for p in parquets)
+    def test_hive_partitioning(self, rte_silver_out):
+        assert any("year=" in str(p) for p in rte_silver_out["parquets"])
 
 
 # ─── Capacity Silver Tests ──────────────────────────────────────────────────
 
+@pytest.fixture(scope="class")
+def capacity_silver(tmp_path_factory):
+    out_dir = tmp_path_factory.mktemp("capacity_silver")
+    result = transform_capacity_to_silver(FIXTURE_DIR / "capacity_sample.csv", out_dir)
+    return _silver_outputs(result, out_dir)
+
+
 class TestCapacitySilver:
-    def test_capacity_transform(self, tmp_path):
-        result = transform_capacity_to_silver(
-            FIXTURE_DIR / "capacity_sample.csv", tmp_path
-        )
+    def test_capacity_transform(self, capacity_silver):
+        result = capacity_silver["result"]
         assert result["status"] == "success"
         assert result["output_rows"] > 0
 
-    def test_parquet_output(self, tmp_path):
-        transform_capacity_to_silver(FIXTURE_DIR / "capacity_sample.csv", tmp_path)
-        parquets = list(tmp_path.rglob("*.parquet"))
-        assert len(parquets) == 1
+    def test_parquet_output(self, capacity_silver):
+        assert len(capacity_silver["parquets"]) == 1
 
 
 # ─── Maintenance Silver Tests ───────────────────────────────────────────────
 
+@pytest.fixture(scope="class")
+def maintenance_silver(tmp_path_factory):
+    events = [
+        {"event_id": "EVT-001", "start_date": "2026-03-01T06:00:00Z",
+         "end_date": "2026-04-15T18:00:00Z", "description": "Visite  décennale",
+         "affected_area": "Hauts-de-France", "unit_name": "GRAVELINES 5"},
+        {"event_id": "EVT-001", "start_date": "2026-03-01T06:00:00Z",
+         "end_date": "2026-04-15T18:00:00Z", "description": "Visite  décennale",
+         "affected_area": "Hauts-de-France", "unit_name": "GRAVELINES 5"},  # Dupe
+        {"event_id": "EVT-002", "start_date": "2026-02-20T14:30:00Z",
+         "end_date": "2026-02-28T23:59:00Z", "description": "Arrêt pompe",
+         "affected_area": "Grand Est", "unit_name": "CATTENOM 3"},
+    ]
+    f = tmp_path_factory.mktemp("maintenance_bronze") / "maintenance.json"
+    f.write_bytes(_dump_json(events))
+
+    out_dir = tmp_path_factory.mktemp("maintenance_silver")
+    result = transform_maintenance_to_silver(f, out_dir)
+    return _silver_outputs(result, out_dir)
+
+
 class TestMaintenanceSilver:
-    @pytest.fixture
-    def maintenance_json(self, tmp_path):
-        events = [
-            {"event_id": "EVT-001", "start_date": "2026-03-01T06:00:00Z",
-             "end_date": "2026-04-15T18:00:00Z", "description": "Visite  décennale",
-             "affected_area": "Hauts-de-France", "unit_name": "GRAVELINES 5"},
-            {"event_id": "EVT-001", "start_date": "2026-03-01T06:00:00Z",
-             "end_date": "2026-04-15T18:00:00Z", "description": "Visite  décennale",
-             "affected_area": "Hauts-de-France", "unit_name": "GRAVELINES 5"},  # Dupe
-            {"event_id": "EVT-002", "start_date": "2026-02-20T14:30:00Z",
-             "end_date": "2026-02-28T23:59:00Z", "description": "Arrêt pompe",
-             "affected_area": "Grand Est", "unit_name": "CATTENOM 3"},
-        ]
-        f = tmp_path / "maintenance.json"
-        f.write_text(json.dumps(events), encoding="utf-8")
-        return f
-
-    def test_maintenance_transform(self, maintenance_json, tmp_path):
-        result = transform_maintenance_to_silver(maintenance_json, tmp_path)
+    def test_maintenance_transform(self, maintenance_silver):
+        result = maintenance_silver["result"]
         assert result["status"] == "success"
         assert result["output_rows"] == 2  # 1 dupe removed
 
-    def test_description_cleaned(self, maintenance_json, tmp_path):
-        transform_maintenance_to_silver(maintenance_json, tmp_path)
-        parquets = list(tmp_path.rglob("*.parquet"))
-        df = pl.read_parquet(parquets[0])
-        for desc in df["description"].to_list():
-            assert "  " not in desc  # No double spaces
+    def test_description_cleaned(self, maintenance_silver):
+        descriptions = (
+            pl.scan_parquet(maintenance_silver["first_parquet"])
+            .select("description")
+            .collect()["description"]
+        )
+        assert not descriptions.str.contains("  ", literal=True).any()  # No double spaces
 
 
 # ─── ERA5 Silver Tests ──────────────────────────────────────────────────────
 
+@pytest.fixture(scope="class")
+def era5_silver(tmp_path_factory):
+    out_dir = tmp_path_factory.mktemp("era5_silver")
+    result = transform_era5_to_silver(FIXTURE_DIR / "era5_sample.parquet", out_dir)
+    return _silver_outputs(result, out_dir)
+
+
 class TestERA5Silver:
-    def test_era5_transform(self, tmp_path):
-        result = transform_era5_to_silver(
-            FIXTURE_DIR / "era5_sample.parquet", tmp_path
-        )
+    def test_era5_transform(self, era5_silver):
+        result = era5_silver["result"]
         assert result["status"] == "success"
         assert result["output_rows"] > 0
 
-    def test_hive_partitioned(self, tmp_path):
-        transform_era5_to_silver(FIXTURE_DIR / "era5_sample.parquet", tmp_path)
-        parquets = list(tmp_path.rglob("*.parquet"))
-        assert any("year=" in str(p) for p in parquets)
-
-    def test_derived_fields(self, tmp_path):
-        transform_era5_to_silver(FIXTURE_DIR / "era5_sample.parquet", tmp_path)
-        parquets = list(tmp_path.rglob("*.parquet"))
-        df = pl.read_parquet(parquets[0])
-        assert "wind_speed_100m" in df.columns
-        assert "temperature_c" in df.columns
+    def test_hive_partitioned(self, era5_silver):
+        assert any("year=" in str(p) for p in era5_silver["parquets"])
+
+    def test_derived_fields(self, era5_silver):
+        schema = pl.scan_parquet(era5_silver["first_parquet"]).collect_schema()
+        assert "wind_speed_100m" in schema
+        assert "temperature_c" in schema